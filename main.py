@@ -7,66 +7,205 @@ how to use the multi-agent D&D Dungeon Master system.
 """
 
 import asyncio
+import functools
+import os
+import re
 import sys
-from typing import Dict, Any
-from multi_agent_tool import dm_collective_agent, initialize_dm_session, DMCollectiveSession
+from importlib import resources
+from typing import Optional, Tuple
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the stdlib event loop
+    uvloop = None
+
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.completion import WordCompleter
+except ImportError:  # prompt_toolkit is optional; fall back to input() in an executor
+    PromptSession = None
+
+from multi_agent_tool import dm_collective_agent, initialize_dm_session, DMCollectiveSession, PartyComposition
+
+# Demo keyword classifier vocabularies (single words or two-word phrases),
+# built once at import so each turn is a single tokenize + set probes.
+# Keywords match whole words, so each verb lists its -s, past and -ing forms.
+_DEMO_OBSERVE_KEYWORDS = frozenset({
+    "look", "looks", "looked", "looking", "examine", "examines", "examined", "examining",
+    "see", "sees", "saw", "seeing",
+})
+_DEMO_COMBAT_KEYWORDS = frozenset({
+    "attack", "attacks", "attacked", "attacking", "fight", "fights", "fought", "fighting",
+    "draw sword", "draws sword", "drew sword", "drawing sword",
+})
+_DEMO_SOCIAL_KEYWORDS = frozenset({
+    "talk", "talks", "talked", "talking", "speak", "speaks", "spoke", "speaking",
+    "approach", "approaches", "approached", "approaching",
+})
+_DEMO_MAGIC_KEYWORDS = frozenset({"cast", "casts", "casting", "spell", "spells", "magic", "magical"})
+
+# Response buckets in priority order
+_DEMO_BUCKET_KEYWORDS = (
+    ("observe", _DEMO_OBSERVE_KEYWORDS),
+    ("combat", _DEMO_COMBAT_KEYWORDS),
+    ("social", _DEMO_SOCIAL_KEYWORDS),
+    ("magic", _DEMO_MAGIC_KEYWORDS),
+)
+# One alternation with a named group per bucket, so a single scan reports
+# which buckets the input mentions
+_DEMO_KEYWORD_RE = re.compile("|".join(
+    rf"\b(?P<{bucket}>{'|'.join(re.escape(keyword) for keyword in sorted(keywords))})\b"
+    for bucket, keywords in _DEMO_BUCKET_KEYWORDS
+))
+
+# Static demo responses, keyed by classifier bucket
+_DEMO_RESPONSE_OBSERVE = """The town square bustles with afternoon activity. Merchants hawk their 
+        wares from colorful stalls, their voices creating a cheerful cacophony. The 
+        scent of roasting meat from a nearby vendor mingles with the earthy smell 
+        of horses and leather. To the east, a weathered inn sign creaks in the 
+        gentle breeze, depicting a prancing unicorn. A group of children play near 
+        a stone fountain at the square's center, their laughter echoing off the 
+        surrounding buildings."""
+
+_DEMO_RESPONSE_COMBAT = """**Rules Check:** You cannot attack in a peaceful town square without 
+        provocation. Such an action would be against local laws and likely result 
+        in intervention by town guards. If you wish to engage in combat, you might 
+        seek out the local training grounds, or perhaps investigate rumors of 
+        monsters in the nearby woods."""
+
+_DEMO_RESPONSE_SOCIAL = """A cheerful halfling merchant notices your approach and grins widely, 
+        revealing a gold tooth. "Well hello there, travelers! Welcome to Millbrook! 
+        Name's Pip Goldleaf, and I've got the finest goods this side of the 
+        Whispering Woods. Looking for supplies for an adventure, perhaps? I've 
+        heard tell of some interesting happenings up in the old ruins lately..."
+        
+        His eyes twinkle with the promise of potential adventure."""
+
+_DEMO_RESPONSE_MAGIC = """**Mechanics:** Casting spells in town requires consideration of local 
+        laws and social norms. Minor cantrips like Prestidigitation are generally 
+        acceptable for entertainment or practical purposes. More powerful magic 
+        might draw unwanted attention or require official permission.
+        
+        The air shimmers slightly as you consider your magical options, and you 
+        notice several townsfolk watching with a mixture of curiosity and caution."""
+
+_DEMO_BUCKET_RESPONSES = {
+    "observe": _DEMO_RESPONSE_OBSERVE,
+    "combat": _DEMO_RESPONSE_COMBAT,
+    "social": _DEMO_RESPONSE_SOCIAL,
+    "magic": _DEMO_RESPONSE_MAGIC,
+}
+
+# Fallback response wrapped around the player's (lowercased) input
+_DEMO_FALLBACK_PREFIX = "You decide to "
+_DEMO_FALLBACK_SUFFIX = """. The AI-DM Collective is 
+        coordinating to provide you with the most appropriate response...
+        
+        **[Demo Mode]** In a full session, this would involve:
+        • The Conductor parsing your intent
+        • Specialist agents analyzing implications  
+        • The Lorekeeper checking narrative consequences
+        • The Chronicler crafting descriptions
+        • The Thespian voicing any NPCs
+        • The Adjudicator validating rules
+        • The Architect considering pacing
+        
+        All working together to create an immersive D&D experience!"""
+
+_STARTING_LOCATION = "Millbrook Town Square"
+
+# Words offered by the interactive prompt's completer
+_COMMAND_WORDS = ["help", "status", "save", "quit", "exit"]
+
+# Environment variable that suppresses automatic status output when stdout is not a terminal
+_QUIET_ENV_VAR = "AI_DM_QUIET"
+
+# Commands that end the session
+_QUIT_COMMANDS = frozenset({'quit', 'exit'})
+
+# Session commands keyed by the first word of the player's input; quit/exit
+# and help only count when they are the whole input
+_COMMAND_HANDLERS = {
+    # Lambdas bind the handlers late, since they are defined further down
+    'status': lambda session: show_game_status(session),
+    'save': lambda session: save_session(session),
+}
+
+# Static console texts, loaded once from the package's data directory and
+# shared by every session in the process
+_TEXT_ASSETS = {
+    name: (resources.files("multi_agent_tool") / "data" / f"{name}.txt").read_text(encoding="utf-8")
+    for name in ("banner", "help", "welcome")
+}
 
 def print_banner():
     """Print the AI-DM Collective banner."""
-    banner = """
-    ╔══════════════════════════════════════════════════════════════╗
-    ║                    AI-DM COLLECTIVE                          ║
-    ║           A Multi-Agent D&D Dungeon Master System           ║
-    ╚══════════════════════════════════════════════════════════════╝
-    
-    The AI-DM Collective consists of six specialized agents:
-    • The Conductor - Orchestrates the entire system
-    • The Lorekeeper - Maintains world lore and narrative
-    • The Chronicler - Provides vivid descriptions  
-    • The Thespian - Embodies all NPCs and characters
-    • The Adjudicator - Enforces rules with perfect consistency
-    • The Architect - Designs encounters and manages pacing
-    """
-    print(banner)
+    sys.stdout.write(_TEXT_ASSETS["banner"])
 
-def get_party_info() -> Dict[str, Any]:
+@functools.lru_cache(maxsize=256)
+def _validate_party(size: str, level: str, classes: str, strengths: str) -> Tuple[int, float, Tuple[str, ...], Tuple[str, ...]]:
+    """Parse and clamp raw party setup answers (raises ValueError on bad numbers)."""
+    party_size = max(1, min(8, int(size or "4")))
+    avg_level = max(1, min(20, float(level or "3")))
+    class_list = tuple(cls.strip().lower() for cls in (classes or "fighter,wizard,cleric,rogue").split(","))
+    strength_list = tuple(s.strip().lower() for s in (strengths or "combat").split(","))
+    return party_size, avg_level, class_list, strength_list
+
+def get_party_info() -> PartyComposition:
     """Get basic party information for session setup."""
     print("\n=== PARTY SETUP ===")
     
+    size_input = input("Enter party size (1-8): ").strip()
+    level_input = input("Enter average party level (1-20): ").strip()
+    
+    print("Enter party classes (comma-separated):")
+    print("Examples: fighter,wizard,cleric,rogue")
+    classes_input = input("Classes: ").strip()
+    
+    print("Enter party strengths (comma-separated):")
+    print("Options: combat, social, exploration, stealth")
+    strengths_input = input("Strengths: ").strip()
+    
     try:
-        party_size = int(input("Enter party size (1-8): ").strip() or "4")
-        party_size = max(1, min(8, party_size))
-        
-        avg_level = float(input("Enter average party level (1-20): ").strip() or "3")
-        avg_level = max(1, min(20, avg_level))
-        
-        print("Enter party classes (comma-separated):")
-        print("Examples: fighter,wizard,cleric,rogue")
-        classes_input = input("Classes: ").strip() or "fighter,wizard,cleric,rogue"
-        classes = [cls.strip().lower() for cls in classes_input.split(",")]
-        
-        print("Enter party strengths (comma-separated):")
-        print("Options: combat, social, exploration, stealth")
-        strengths_input = input("Strengths: ").strip() or "combat"
-        strengths = [s.strip().lower() for s in strengths_input.split(",")]
-        
-        return {
-            "size": party_size,
-            "average_level": avg_level,
-            "classes": classes,
-            "strengths": strengths,
-            "weaknesses": []
-        }
-        
-    except (ValueError, KeyboardInterrupt):
+        party_size, avg_level, classes, strengths = _validate_party(
+            size_input, level_input, classes_input, strengths_input
+        )
+    except ValueError:
         print("Using default party setup...")
-        return {
-            "size": 4,
-            "average_level": 3,
-            "classes": ["fighter", "wizard", "cleric", "rogue"],
-            "strengths": ["combat"],
-            "weaknesses": []
-        }
+        return PartyComposition(
+            size=4,
+            average_level=3,
+            classes=["fighter", "wizard", "cleric", "rogue"],
+            strengths=["combat"],
+            weaknesses=[]
+        )
+    
+    return PartyComposition(
+        size=party_size,
+        average_level=avg_level,
+        classes=list(classes),
+        strengths=list(strengths),
+        weaknesses=[]
+    )
+
+def _bootstrap_session(session: DMCollectiveSession):
+    """Show the opening scene and place the party at the starting location."""
+    
+    print(_TEXT_ASSETS["welcome"])
+    
+    # Set initial game state
+    session.game_state.current_location = _STARTING_LOCATION
+    session.game_state.log_event("location_change", "Party arrived in Millbrook", "system")
+
+def _make_input_reader():
+    """Return a coroutine function that reads one line of player input."""
+    if PromptSession is not None and sys.stdin.isatty():
+        # Native asyncio prompt with history and command completion
+        prompt_session = PromptSession(completer=WordCompleter(_COMMAND_WORDS, ignore_case=True))
+        return lambda: prompt_session.prompt_async("\n> ")
+    
+    loop = asyncio.get_running_loop()
+    return lambda: loop.run_in_executor(None, input, "\n> ")
 
 async def run_dm_session(session: DMCollectiveSession):
     """Run an interactive DM session."""
@@ -75,43 +214,29 @@ async def run_dm_session(session: DMCollectiveSession):
     print("Type 'help' for commands, 'quit' to exit")
     print("=" * 50)
     
-    # Welcome message
-    welcome_msg = """
-    Welcome, brave adventurers! You find yourselves at the edge of a small 
-    frontier town called Millbrook. The cobblestone streets are busy with 
-    merchants and travelers, and the air carries the scent of fresh bread 
-    from the local bakery. To the north, dark woods stretch toward distant 
-    mountains where ancient ruins are said to lie hidden.
+    _bootstrap_session(session)
     
-    What would you like to do?
-    """
-    
-    print(welcome_msg)
-    
-    # Set initial game state
-    session.game_state.current_location = "Millbrook Town Square"
-    session.game_state.log_event("location_change", "Party arrived in Millbrook", "system")
+    read_input = _make_input_reader()
     
     while True:
         try:
-            # Get player input
-            player_input = input("\n> ").strip()
+            # Get player input without blocking the event loop
+            player_input = (await read_input()).strip()
             
             if not player_input:
                 continue
             
-            # Handle special commands
-            if player_input.lower() in ['quit', 'exit']:
+            # Handle special commands (lowercased once per turn)
+            input_lower = player_input.lower()
+            if input_lower in _QUIT_COMMANDS:
                 print("\nThanks for playing! May your adventures continue...")
                 break
-            elif player_input.lower() == 'help':
+            if input_lower == 'help':
                 show_help()
                 continue
-            elif player_input.lower().startswith('status'):
-                show_game_status(session)
-                continue
-            elif player_input.lower().startswith('save'):
-                save_session(session)
+            handler = _COMMAND_HANDLERS.get(input_lower.split(maxsplit=1)[0])
+            if handler is not None:
+                handler(session)
                 continue
             
             # Process input through the AI-DM Collective
@@ -122,11 +247,10 @@ async def run_dm_session(session: DMCollectiveSession):
             # response = await process_player_input(session, player_input)
             
             # Simulate processing time
-            import time
-            time.sleep(1)
+            await asyncio.sleep(1)
             
             # Generate a demo response
-            demo_response = generate_demo_response(player_input, session)
+            demo_response = generate_demo_response(player_input, input_lower, session)
             print(demo_response)
             
         except KeyboardInterrupt:
@@ -135,89 +259,42 @@ async def run_dm_session(session: DMCollectiveSession):
         except Exception as e:
             print(f"\nError occurred: {e}")
             print("The DM collective is recovering...")
+    
+    # Let any callbacks still queued on the loop run before shutdown
+    await asyncio.sleep(0)
 
-def generate_demo_response(player_input: str, session: DMCollectiveSession) -> str:
+def _classify_demo_input(input_lower: str) -> Optional[str]:
+    """Return the highest-priority demo response bucket matched by the input."""
+    matched = {match.lastgroup for match in _DEMO_KEYWORD_RE.finditer(input_lower)}
+    
+    for bucket, _ in _DEMO_BUCKET_KEYWORDS:
+        if bucket in matched:
+            return bucket
+    return None
+
+def generate_demo_response(player_input: str, input_lower: str, session: DMCollectiveSession) -> str:
     """Generate a demonstration response showing multi-agent coordination."""
     
-    input_lower = player_input.lower()
+    bucket = _classify_demo_input(input_lower)
     
     # Simulate different types of responses based on input
-    if any(word in input_lower for word in ["look", "examine", "see"]):
-        return """The town square bustles with afternoon activity. Merchants hawk their 
-        wares from colorful stalls, their voices creating a cheerful cacophony. The 
-        scent of roasting meat from a nearby vendor mingles with the earthy smell 
-        of horses and leather. To the east, a weathered inn sign creaks in the 
-        gentle breeze, depicting a prancing unicorn. A group of children play near 
-        a stone fountain at the square's center, their laughter echoing off the 
-        surrounding buildings."""
-        
-    elif any(word in input_lower for word in ["attack", "fight", "draw sword"]):
-        return """**Rules Check:** You cannot attack in a peaceful town square without 
-        provocation. Such an action would be against local laws and likely result 
-        in intervention by town guards. If you wish to engage in combat, you might 
-        seek out the local training grounds, or perhaps investigate rumors of 
-        monsters in the nearby woods."""
-        
-    elif any(word in input_lower for word in ["talk", "speak", "approach"]):
-        return """A cheerful halfling merchant notices your approach and grins widely, 
-        revealing a gold tooth. "Well hello there, travelers! Welcome to Millbrook! 
-        Name's Pip Goldleaf, and I've got the finest goods this side of the 
-        Whispering Woods. Looking for supplies for an adventure, perhaps? I've 
-        heard tell of some interesting happenings up in the old ruins lately..."
-        
-        His eyes twinkle with the promise of potential adventure."""
-        
-    elif any(word in input_lower for word in ["cast", "spell", "magic"]):
-        return """**Mechanics:** Casting spells in town requires consideration of local 
-        laws and social norms. Minor cantrips like Prestidigitation are generally 
-        acceptable for entertainment or practical purposes. More powerful magic 
-        might draw unwanted attention or require official permission.
-        
-        The air shimmers slightly as you consider your magical options, and you 
-        notice several townsfolk watching with a mixture of curiosity and caution."""
-        
-    else:
-        # General exploration response
-        return f"""You decide to {player_input.lower()}. The AI-DM Collective is 
-        coordinating to provide you with the most appropriate response...
-        
-        **[Demo Mode]** In a full session, this would involve:
-        • The Conductor parsing your intent
-        • Specialist agents analyzing implications  
-        • The Lorekeeper checking narrative consequences
-        • The Chronicler crafting descriptions
-        • The Thespian voicing any NPCs
-        • The Adjudicator validating rules
-        • The Architect considering pacing
-        
-        All working together to create an immersive D&D experience!"""
+    if bucket is not None:
+        return _DEMO_BUCKET_RESPONSES[bucket]
+    
+    # General exploration response
+    return "".join((_DEMO_FALLBACK_PREFIX, input_lower, _DEMO_FALLBACK_SUFFIX))
 
 def show_help():
     """Display help information."""
-    help_text = """
-    AVAILABLE COMMANDS:
-    
-    • help         - Show this help message
-    • status       - Display current game status  
-    • quit/exit    - End the session
-    • save         - Save current session state
-    
-    GAMEPLAY:
-    Simply describe what your character wants to do in natural language.
-    Examples:
-    • "I examine the fountain in the square"
-    • "I approach the merchant and ask about rumors"
-    • "I cast Light on my staff" 
-    • "I search for a tavern"
-    
-    The AI-DM Collective will coordinate multiple specialist agents to 
-    provide comprehensive responses covering rules, narrative, NPCs, 
-    descriptions, and pacing.
-    """
-    print(help_text)
+    sys.stdout.write(_TEXT_ASSETS["help"])
 
-def show_game_status(session: DMCollectiveSession):
-    """Display current game status."""
+def show_game_status(session: DMCollectiveSession, automatic: bool = False):
+    """Display current game status (automatic polls honour quiet mode)."""
+    # Skip formatting entirely for automatic polls when output is redirected and
+    # quiet mode is on; an explicit status command always prints
+    if automatic and os.environ.get(_QUIET_ENV_VAR) and not sys.stdout.isatty():
+        return
+    
     status = f"""
     CURRENT GAME STATUS:
     
@@ -270,8 +347,11 @@ async def main():
     await run_dm_session(session)
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
+    
     try:
-        asyncio.run(main())
+        asyncio.run(main(), debug=False)
     except KeyboardInterrupt:
         print("\n\nGoodbye!")
         sys.exit(0)
\ No newline at end of file
@@ -1,23 +1,45 @@
-from .dm_collective import dm_collective_agent, initialize_dm_session, DMCollectiveSession
-from .conductor import conductor_agent
-from .lorekeeper import lorekeeper_agent  
-from .chronicler import chronicler_agent
-from .thespian import thespian_agent
-from .adjudicator import adjudicator_agent
-from .architect import architect_agent
+import importlib
 
-# Set the root agent for ADK
-root_agent = dm_collective_agent
+# Every export is resolved on first attribute access (PEP 562), so importing the
+# package (or one of its lightweight submodules) does not load the agent modules.
+# Maps exported name -> (submodule, attribute).
+_LAZY_EXPORTS = {
+    'dm_collective_agent': ('.dm_collective', 'dm_collective_agent'),
+    'root_agent': ('.dm_collective', 'dm_collective_agent'),
+    'initialize_dm_session': ('.dm_collective', 'initialize_dm_session'),
+    'DMCollectiveSession': ('.dm_collective', 'DMCollectiveSession'),
+    'PartyComposition': ('.architect', 'PartyComposition'),
+    'conductor_agent': ('.conductor', 'conductor_agent'),
+    'lorekeeper_agent': ('.lorekeeper', 'lorekeeper_agent'),
+    'chronicler_agent': ('.chronicler', 'chronicler_agent'),
+    'thespian_agent': ('.thespian', 'thespian_agent'),
+    'adjudicator_agent': ('.adjudicator', 'adjudicator_agent'),
+    'architect_agent': ('.architect', 'architect_agent'),
+}
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module_name, attribute = _LAZY_EXPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attribute)
+        # Bind the resolved value so later lookups skip __getattr__ entirely
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 # Export the main DM collective agent as the primary interface
+# (root_agent is the DM collective agent, for ADK)
 __all__ = [
     'dm_collective_agent',
     'root_agent',
-    'initialize_dm_session', 
+    'initialize_dm_session',
     'DMCollectiveSession',
+    'PartyComposition',
     'conductor_agent',
     'lorekeeper_agent',
-    'chronicler_agent', 
+    'chronicler_agent',
     'thespian_agent',
     'adjudicator_agent',
     'architect_agent'
@@ -9,11 +9,13 @@ and a deterministic back-end for rule enforcement.
 """
 
 from google.adk.agents import Agent
-from typing import Dict, List, Any, Optional, Union
-import json
+from typing import Dict, List, Any, Optional, Union, FrozenSet, Mapping
+import bisect
+import functools
+import re
 from dataclasses import dataclass
 from enum import Enum
-import math
+from types import MappingProxyType
 
 class ActionType(Enum):
     ABILITY_CHECK = "ability_check"
@@ -33,7 +35,10 @@ class DifficultyClass(Enum):
     VERY_HARD = 25
     NEARLY_IMPOSSIBLE = 30
 
-@dataclass
+# Shared placeholder for absent list fields in serialized queries
+_EMPTY = ()
+
+@dataclass(slots=True)
 class RuleQuery:
     """Structured representation of a rule query."""
     action_type: ActionType
@@ -55,11 +60,11 @@ class RuleQuery:
             "target_ac": self.target_ac,
             "character_level": self.character_level,
             "character_class": self.character_class,
-            "modifiers": self.modifiers or [],
-            "environmental_factors": self.environmental_factors or []
+            "modifiers": self.modifiers if self.modifiers is not None else _EMPTY,
+            "environmental_factors": self.environmental_factors if self.environmental_factors is not None else _EMPTY
         }
 
-@dataclass
+@dataclass(slots=True)
 class RuleResult:
     """Result of rule processing."""
     is_legal: bool
@@ -71,129 +76,157 @@ class RuleResult:
     conditions_applied: List[str] = None
     additional_effects: List[str] = None
 
+# Static D&D 5e rule tables, shared read-only by every rule engine
+_ABILITY_SCORES = ("strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma")
+
+_SKILLS = MappingProxyType({
+    "athletics": "strength",
+    "acrobatics": "dexterity", 
+    "sleight_of_hand": "dexterity",
+    "stealth": "dexterity",
+    "arcana": "intelligence",
+    "history": "intelligence", 
+    "investigation": "intelligence",
+    "nature": "intelligence",
+    "religion": "intelligence",
+    "animal_handling": "wisdom",
+    "insight": "wisdom",
+    "medicine": "wisdom",
+    "perception": "wisdom",
+    "survival": "wisdom",
+    "deception": "charisma",
+    "intimidation": "charisma",
+    "performance": "charisma",
+    "persuasion": "charisma"
+})
+
+_SPELL_DATABASE = MappingProxyType({
+    "fireball": {
+        "level": 3,
+        "school": "evocation",
+        "casting_time": "1 action",
+        "range": "150 feet",
+        "components": ["V", "S", "M"],
+        "duration": "instantaneous",
+        "damage": "8d6",
+        "damage_type": "fire",
+        "save": "dexterity",
+        "area_of_effect": "20-foot radius sphere"
+    },
+    "cure_wounds": {
+        "level": 1,
+        "school": "evocation", 
+        "casting_time": "1 action",
+        "range": "touch",
+        "components": ["V", "S"],
+        "duration": "instantaneous",
+        "healing": "1d8 + spellcasting_modifier"
+    },
+    "magic_missile": {
+        "level": 1,
+        "school": "evocation",
+        "casting_time": "1 action", 
+        "range": "120 feet",
+        "components": ["V", "S"],
+        "duration": "instantaneous",
+        "damage": "1d4+1",
+        "damage_type": "force",
+        "auto_hit": True
+    },
+    "counterspell": {
+        "level": 3,
+        "school": "abjuration",
+        "casting_time": "1 reaction",
+        "range": "60 feet", 
+        "components": ["S"],
+        "duration": "instantaneous",
+        "save": "none"
+    }
+})
+
+# Which classes can cast which spells
+_CLASS_SPELL_LISTS: Mapping[str, FrozenSet[str]] = MappingProxyType({
+    "wizard": frozenset({"fireball", "magic_missile", "counterspell"}),
+    "sorcerer": frozenset({"fireball", "magic_missile", "counterspell"}), 
+    "cleric": frozenset({"cure_wounds"}),
+    "paladin": frozenset({"cure_wounds"}),
+    "bard": frozenset({"cure_wounds", "counterspell"}),
+    "druid": frozenset({"cure_wounds"}),
+    "warlock": frozenset({"fireball", "counterspell"}),
+    "ranger": frozenset({"cure_wounds"}),
+    "eldritch_knight": frozenset({"magic_missile", "fireball"}),
+    "arcane_trickster": frozenset({"magic_missile"})
+})
+
+# DifficultyClass values resolved once instead of through the Enum machinery per call
+_MEDIUM_DC = DifficultyClass.MEDIUM.value
+_MIN_DC = DifficultyClass.TRIVIAL.value
+_MAX_DC = DifficultyClass.NEARLY_IMPOSSIBLE.value
+
+# Inclusive upper DC bound of each difficulty tier (for bisect); a DC above
+# the last bound falls in the final tier
+_DC_TIER_BOUNDS = (
+    DifficultyClass.EASY.value,
+    DifficultyClass.MEDIUM.value,
+    DifficultyClass.HARD.value,
+    DifficultyClass.VERY_HARD.value
+)
+_DC_TIER_NAMES = ("Easy", "Medium", "Hard", "Very Hard", "Nearly Impossible")
+
+# DC adjustments per environmental factor, one named group per tier and
+# checked in priority order
+_DC_FACTOR_RE = re.compile(
+    r"\b(?P<easier>easy|simple|favorable)"
+    r"|\b(?P<harder>difficult|challenging|adverse)"
+    r"|\b(?P<extreme>very hard|nearly impossible|extreme)"
+)
+_DC_FACTOR_DELTAS = (("easier", -3), ("harder", 3), ("extreme", 8))
+
+# DC adjustments per modifier: advantage is an effective bonus, disadvantage a penalty
+_DC_MODIFIER_RE = re.compile(r"\b(?P<advantage>advantage)|\b(?P<disadvantage>disadvantage)")
+_DC_MODIFIER_DELTAS = (("advantage", -2), ("disadvantage", 2))
+
+def _match_dc_delta(text: str, pattern: re.Pattern, deltas: tuple) -> int:
+    """Return the DC delta for the highest-priority group ``pattern`` finds in ``text``."""
+    matched = {match.lastgroup for match in pattern.finditer(text)}
+    for group, delta in deltas:
+        if group in matched:
+            return delta
+    return 0
+
 # Core D&D 5e rule engine - deterministic rule processing
 class DnD5eRuleEngine:
     """Deterministic rule engine for D&D 5e mechanics."""
     
     def __init__(self):
-        self.ability_scores = ["strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma"]
-        self.skills = {
-            "athletics": "strength",
-            "acrobatics": "dexterity", 
-            "sleight_of_hand": "dexterity",
-            "stealth": "dexterity",
-            "arcana": "intelligence",
-            "history": "intelligence", 
-            "investigation": "intelligence",
-            "nature": "intelligence",
-            "religion": "intelligence",
-            "animal_handling": "wisdom",
-            "insight": "wisdom",
-            "medicine": "wisdom",
-            "perception": "wisdom",
-            "survival": "wisdom",
-            "deception": "charisma",
-            "intimidation": "charisma",
-            "performance": "charisma",
-            "persuasion": "charisma"
-        }
-        
-        self.spell_database = self._init_spell_database()
-        self.class_spell_lists = self._init_class_spell_lists()
-    
-    def _init_spell_database(self) -> Dict[str, Dict]:
-        """Initialize basic spell database."""
-        return {
-            "fireball": {
-                "level": 3,
-                "school": "evocation",
-                "casting_time": "1 action",
-                "range": "150 feet",
-                "components": ["V", "S", "M"],
-                "duration": "instantaneous",
-                "damage": "8d6",
-                "damage_type": "fire",
-                "save": "dexterity",
-                "area_of_effect": "20-foot radius sphere"
-            },
-            "cure_wounds": {
-                "level": 1,
-                "school": "evocation", 
-                "casting_time": "1 action",
-                "range": "touch",
-                "components": ["V", "S"],
-                "duration": "instantaneous",
-                "healing": "1d8 + spellcasting_modifier"
-            },
-            "magic_missile": {
-                "level": 1,
-                "school": "evocation",
-                "casting_time": "1 action", 
-                "range": "120 feet",
-                "components": ["V", "S"],
-                "duration": "instantaneous",
-                "damage": "1d4+1",
-                "damage_type": "force",
-                "auto_hit": True
-            },
-            "counterspell": {
-                "level": 3,
-                "school": "abjuration",
-                "casting_time": "1 reaction",
-                "range": "60 feet", 
-                "components": ["S"],
-                "duration": "instantaneous",
-                "save": "none"
-            }
-        }
-    
-    def _init_class_spell_lists(self) -> Dict[str, List[str]]:
-        """Initialize which classes can cast which spells."""
-        return {
-            "wizard": ["fireball", "magic_missile", "counterspell"],
-            "sorcerer": ["fireball", "magic_missile", "counterspell"], 
-            "cleric": ["cure_wounds"],
-            "paladin": ["cure_wounds"],
-            "bard": ["cure_wounds", "counterspell"],
-            "druid": ["cure_wounds"],
-            "warlock": ["fireball", "counterspell"],
-            "ranger": ["cure_wounds"],
-            "eldritch_knight": ["magic_missile", "fireball"],
-            "arcane_trickster": ["magic_missile"]
-        }
+        self.ability_scores = _ABILITY_SCORES
+        self.skills = _SKILLS
+        self.spell_database = _SPELL_DATABASE
+        self.class_spell_lists = _CLASS_SPELL_LISTS
     
     def process_rule_query(self, query: RuleQuery) -> RuleResult:
         """Process a structured rule query and return deterministic results."""
         
-        if query.action_type == ActionType.SKILL_CHECK:
-            return self._process_skill_check(query)
-        elif query.action_type == ActionType.ABILITY_CHECK:
-            return self._process_ability_check(query)
-        elif query.action_type == ActionType.SAVING_THROW:
-            return self._process_saving_throw(query)
-        elif query.action_type == ActionType.SPELL_CAST:
-            return self._process_spell_cast(query)
-        elif query.action_type == ActionType.ATTACK_ROLL:
-            return self._process_attack_roll(query)
-        elif query.action_type == ActionType.MOVEMENT:
-            return self._process_movement(query)
-        else:
+        handler = self._DISPATCH.get(query.action_type)
+        if handler is None:
             return RuleResult(
                 is_legal=False,
                 explanation=f"Unknown action type: {query.action_type}"
             )
+        return handler(query)
     
-    def _process_skill_check(self, query: RuleQuery) -> RuleResult:
+    @staticmethod
+    def _process_skill_check(query: RuleQuery) -> RuleResult:
         """Process skill check rules."""
-        if not query.skill or query.skill.lower() not in self.skills:
+        skill_name = query.skill.lower() if query.skill else None
+        if not skill_name or skill_name not in _SKILLS:
             return RuleResult(
                 is_legal=False,
                 explanation=f"Invalid skill: {query.skill}"
             )
         
-        skill_name = query.skill.lower()
-        ability = self.skills[skill_name]
-        dc = self._calculate_dc(query)
+        ability = _SKILLS[skill_name]
+        dc = DnD5eRuleEngine._calculate_dc(query)
         
         return RuleResult(
             is_legal=True,
@@ -202,16 +235,17 @@ class DnD5eRuleEngine:
             dc=dc
         )
     
-    def _process_ability_check(self, query: RuleQuery) -> RuleResult:
+    @staticmethod
+    def _process_ability_check(query: RuleQuery) -> RuleResult:
         """Process ability check rules."""
-        if not query.ability_score or query.ability_score.lower() not in self.ability_scores:
+        ability = query.ability_score.lower() if query.ability_score else None
+        if not ability or ability not in _ABILITY_SCORES:
             return RuleResult(
                 is_legal=False,
                 explanation=f"Invalid ability score: {query.ability_score}"
             )
         
-        ability = query.ability_score.lower()
-        dc = self._calculate_dc(query)
+        dc = DnD5eRuleEngine._calculate_dc(query)
         
         return RuleResult(
             is_legal=True,
@@ -220,16 +254,17 @@ class DnD5eRuleEngine:
             dc=dc
         )
     
-    def _process_saving_throw(self, query: RuleQuery) -> RuleResult:
+    @staticmethod
+    def _process_saving_throw(query: RuleQuery) -> RuleResult:
         """Process saving throw rules."""
-        if not query.ability_score or query.ability_score.lower() not in self.ability_scores:
+        ability = query.ability_score.lower() if query.ability_score else None
+        if not ability or ability not in _ABILITY_SCORES:
             return RuleResult(
                 is_legal=False,
                 explanation=f"Invalid saving throw: {query.ability_score}"
             )
         
-        ability = query.ability_score.lower()
-        dc = self._calculate_dc(query)
+        dc = DnD5eRuleEngine._calculate_dc(query)
         
         return RuleResult(
             is_legal=True,
@@ -238,7 +273,8 @@ class DnD5eRuleEngine:
             dc=dc
         )
     
-    def _process_spell_cast(self, query: RuleQuery) -> RuleResult:
+    @staticmethod
+    def _process_spell_cast(query: RuleQuery) -> RuleResult:
         """Process spell casting rules."""
         if not query.spell_name:
             return RuleResult(
@@ -248,24 +284,24 @@ class DnD5eRuleEngine:
         
         spell_name = query.spell_name.lower()
         
-        if spell_name not in self.spell_database:
+        if spell_name not in _SPELL_DATABASE:
             return RuleResult(
                 is_legal=False,
                 explanation=f"Unknown spell: {query.spell_name}"
             )
         
-        spell = self.spell_database[spell_name]
+        spell = _SPELL_DATABASE[spell_name]
         
         # Check if class can cast this spell
         if query.character_class:
             class_name = query.character_class.lower()
-            if class_name not in self.class_spell_lists:
+            if class_name not in _CLASS_SPELL_LISTS:
                 return RuleResult(
                     is_legal=False,
                     explanation=f"Unknown class: {query.character_class}"
                 )
             
-            if spell_name not in self.class_spell_lists[class_name]:
+            if spell_name not in _CLASS_SPELL_LISTS[class_name]:
                 return RuleResult(
                     is_legal=False,
                     explanation=f"{query.character_class} cannot cast {query.spell_name}"
@@ -307,7 +343,8 @@ class DnD5eRuleEngine:
             additional_effects=additional_effects
         )
     
-    def _process_attack_roll(self, query: RuleQuery) -> RuleResult:
+    @staticmethod
+    def _process_attack_roll(query: RuleQuery) -> RuleResult:
         """Process attack roll rules."""
         if not query.target_ac:
             return RuleResult(
@@ -322,18 +359,20 @@ class DnD5eRuleEngine:
             dc=query.target_ac
         )
     
-    def _process_movement(self, query: RuleQuery) -> RuleResult:
+    @staticmethod
+    def _process_movement(query: RuleQuery) -> RuleResult:
         """Process movement rules."""
         # Basic movement is always legal unless specific restrictions apply
         restrictions = []
         
         if query.environmental_factors:
             for factor in query.environmental_factors:
-                if "difficult terrain" in factor.lower():
+                factor_lower = factor.lower()
+                if "difficult terrain" in factor_lower:
                     restrictions.append("Difficult terrain: movement costs double")
-                if "prone" in factor.lower():
+                if "prone" in factor_lower:
                     restrictions.append("Standing from prone costs half movement")
-                if "grappled" in factor.lower():
+                if "grappled" in factor_lower:
                     restrictions.append("Grappled: speed is 0")
         
         if restrictions:
@@ -348,34 +387,116 @@ class DnD5eRuleEngine:
             explanation="Normal movement within speed limit"
         )
     
-    def _calculate_dc(self, query: RuleQuery) -> int:
+    @staticmethod
+    def _calculate_dc(query: RuleQuery) -> int:
         """Calculate appropriate DC based on query parameters."""
-        base_dc = DifficultyClass.MEDIUM.value  # Default DC 15
+        base_dc = _MEDIUM_DC  # Default DC 15
         
         # Adjust based on environmental factors
         if query.environmental_factors:
             for factor in query.environmental_factors:
-                factor_lower = factor.lower()
-                if any(word in factor_lower for word in ["easy", "simple", "favorable"]):
-                    base_dc -= 3
-                elif any(word in factor_lower for word in ["difficult", "challenging", "adverse"]):
-                    base_dc += 3
-                elif any(word in factor_lower for word in ["very hard", "nearly impossible", "extreme"]):
-                    base_dc += 8
+                delta = _CANONICAL_FACTOR_DELTAS.get(factor)
+                if delta is None:
+                    delta = _match_dc_delta(factor.lower(), _DC_FACTOR_RE, _DC_FACTOR_DELTAS)
+                base_dc += delta
         
         # Adjust based on modifiers
         if query.modifiers:
             for modifier in query.modifiers:
-                modifier_lower = modifier.lower()
-                if "advantage" in modifier_lower:
-                    base_dc -= 2  # Effective bonus
-                elif "disadvantage" in modifier_lower:
-                    base_dc += 2  # Effective penalty
+                delta = _CANONICAL_MODIFIER_DELTAS.get(modifier)
+                if delta is None:
+                    delta = _match_dc_delta(modifier.lower(), _DC_MODIFIER_RE, _DC_MODIFIER_DELTAS)
+                base_dc += delta
         
-        return max(5, min(30, base_dc))
+        return max(_MIN_DC, min(_MAX_DC, base_dc))
+    
+    # Handlers for each supported action type; stateless, so no bound methods
+    _DISPATCH = {
+        ActionType.SKILL_CHECK: _process_skill_check,
+        ActionType.ABILITY_CHECK: _process_ability_check,
+        ActionType.SAVING_THROW: _process_saving_throw,
+        ActionType.SPELL_CAST: _process_spell_cast,
+        ActionType.ATTACK_ROLL: _process_attack_roll,
+        ActionType.MOVEMENT: _process_movement
+    }
+
+# The engine holds only static rule tables, so one shared instance serves every call
+_RULE_ENGINE = DnD5eRuleEngine()
+
+# Words that select the action type of a natural language query
+_QUERY_TOKEN_RE = re.compile(r"[a-z_]+")
+# Skill words -> rule-table skill, in priority order (earlier entries win). The same
+# tokens select SKILL_CHECK and name the skill, so the two can never disagree;
+# derived forms such as "stealthily" are listed next to their skill.
+_SKILL_WORDS = {
+    "athletics": "athletics",
+    "acrobatics": "acrobatics",
+    "sleight": "sleight_of_hand",
+    "stealth": "stealth", "stealthy": "stealth", "stealthily": "stealth",
+    "arcana": "arcana",
+    "history": "history",
+    "investigation": "investigation",
+    "nature": "nature",
+    "religion": "religion",
+    "animal": "animal_handling",
+    "insight": "insight", "insightful": "insight",
+    "medicine": "medicine",
+    "perception": "perception",
+    "survival": "survival",
+    "deception": "deception",
+    "intimidation": "intimidation",
+    "performance": "performance",
+    "persuasion": "persuasion",
+}
+_SAVE_WORDS = frozenset({"save", "saves", "saved", "saving"})
+_ATTACK_WORDS = frozenset({"attack", "attacks", "attacked", "attacking"})
+_CAST_WORDS = frozenset({"cast", "casts", "casting"})
+_SPELL_WORDS = frozenset({"spell", "spells", "counterspell"})
+_MOVE_WORDS = frozenset({"move", "moves", "moved", "moving", "movement"})
+
+# Vocabulary recognised by parse_natural_language_query
+_SPELL_PHRASES = ("fireball", "cure wounds", "magic missile", "counterspell", "healing word", "eldritch blast")
+_MODIFIER_PHRASES = ("advantage", "disadvantage")
+_ENVIRONMENT_PHRASES = {
+    "difficult terrain": "difficult terrain",
+    "darkness": "poor visibility",
+    "dim light": "poor visibility",
+    "rain": "adverse weather",
+    "storm": "adverse weather"
+}
+_ENVIRONMENT_FACTORS = ("difficult terrain", "poor visibility", "adverse weather")
+
+# DC deltas for the canonical terms the parser emits, precomputed so
+# _calculate_dc only falls back to pattern matching for free-form input
+_CANONICAL_FACTOR_DELTAS = {
+    factor: _match_dc_delta(factor, _DC_FACTOR_RE, _DC_FACTOR_DELTAS) for factor in _ENVIRONMENT_FACTORS
+}
+_CANONICAL_MODIFIER_DELTAS = {
+    modifier: _match_dc_delta(modifier, _DC_MODIFIER_RE, _DC_MODIFIER_DELTAS) for modifier in _MODIFIER_PHRASES
+}
+
+# phrase -> (kind, value) for every phrase above
+_QUERY_VOCABULARY = {
+    **{phrase: ("ability", phrase) for phrase in _ABILITY_SCORES},
+    **{phrase: ("spell", phrase) for phrase in _SPELL_PHRASES},
+    **{phrase: ("modifier", phrase) for phrase in _MODIFIER_PHRASES},
+    **{phrase: ("environment", factor) for phrase, factor in _ENVIRONMENT_PHRASES.items()}
+}
+_QUERY_VOCABULARY_KINDS = ("ability", "spell", "modifier", "environment")
+
+# One alternation over the whole vocabulary, longest phrases first. Matches
+# must start on a word boundary so "disadvantage" does not also read as
+# "advantage" and "terrain" does not read as "rain".
+_QUERY_VOCABULARY_RE = re.compile(
+    r"\b(" + "|".join(re.escape(phrase) for phrase in sorted(_QUERY_VOCABULARY, key=len, reverse=True)) + ")"
+)
 
 def parse_natural_language_query(query_text: str, context: Dict[str, Any] = None) -> RuleQuery:
-    """Parse natural language into a structured rule query."""
+    """Parse natural language into a structured rule query.
+    
+    >>> parse_natural_language_query("stealthily sneak past").skill
+    'stealth'
+    """
     
     if context is None:
         context = {}
@@ -384,81 +505,34 @@ def parse_natural_language_query(query_text: str, context: Dict[str, Any] = None
     
     # Determine action type
     action_type = ActionType.ABILITY_CHECK  # Default
+    tokens = set(_QUERY_TOKEN_RE.findall(query_lower))
     
-    if any(skill in query_lower for skill in ["athletics", "acrobatics", "sleight", "stealth", "arcana", 
-                                             "history", "investigation", "nature", "religion", "animal",
-                                             "insight", "medicine", "perception", "survival", "deception",
-                                             "intimidation", "performance", "persuasion"]):
+    skill = next((name for word, name in _SKILL_WORDS.items() if word in tokens), None)
+    
+    if skill is not None:
         action_type = ActionType.SKILL_CHECK
-    elif "saving throw" in query_lower or "save" in query_lower:
+    elif not tokens.isdisjoint(_SAVE_WORDS):
         action_type = ActionType.SAVING_THROW
-    elif "attack" in query_lower:
+    elif not tokens.isdisjoint(_ATTACK_WORDS):
         action_type = ActionType.ATTACK_ROLL
-    elif "cast" in query_lower and "spell" in query_lower:
+    elif not tokens.isdisjoint(_CAST_WORDS) and not tokens.isdisjoint(_SPELL_WORDS):
         action_type = ActionType.SPELL_CAST
-    elif "move" in query_lower or "movement" in query_lower:
+    elif not tokens.isdisjoint(_MOVE_WORDS):
         action_type = ActionType.MOVEMENT
     
-    # Extract specific elements
-    ability_score = None
-    skill = None
-    spell_name = None
-    
-    # Extract ability scores
-    for ability in ["strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma"]:
-        if ability in query_lower:
-            ability_score = ability
-            break
-    
-    # Extract skills
-    skill_mapping = {
-        "athletics": "athletics",
-        "acrobatics": "acrobatics", 
-        "sleight of hand": "sleight_of_hand",
-        "stealth": "stealth",
-        "arcana": "arcana",
-        "history": "history",
-        "investigation": "investigation", 
-        "nature": "nature",
-        "religion": "religion",
-        "animal handling": "animal_handling",
-        "insight": "insight",
-        "medicine": "medicine",
-        "perception": "perception",
-        "survival": "survival",
-        "deception": "deception",
-        "intimidation": "intimidation",
-        "performance": "performance",
-        "persuasion": "persuasion"
-    }
-    
-    for skill_phrase, skill_name in skill_mapping.items():
-        if skill_phrase in query_lower:
-            skill = skill_name
-            break
+    # Find every vocabulary phrase in a single scan of the query
+    found = {kind: set() for kind in _QUERY_VOCABULARY_KINDS}
+    for match in _QUERY_VOCABULARY_RE.finditer(query_lower):
+        kind, value = _QUERY_VOCABULARY[match.group(1)]
+        found[kind].add(value)
     
-    # Extract spell names (basic detection)
-    spell_names = ["fireball", "cure wounds", "magic missile", "counterspell", "healing word", "eldritch blast"]
-    for spell in spell_names:
-        if spell in query_lower:
-            spell_name = spell
-            break
+    # Extract specific elements (earlier vocabulary entries win)
+    ability_score = next((a for a in _ABILITY_SCORES if a in found["ability"]), None)
+    spell_name = next((s for s in _SPELL_PHRASES if s in found["spell"]), None)
     
     # Extract modifiers and environmental factors
-    modifiers = []
-    environmental_factors = []
-    
-    if "advantage" in query_lower:
-        modifiers.append("advantage")
-    if "disadvantage" in query_lower:
-        modifiers.append("disadvantage")
-    
-    if "difficult terrain" in query_lower:
-        environmental_factors.append("difficult terrain")
-    if "darkness" in query_lower or "dim light" in query_lower:
-        environmental_factors.append("poor visibility")
-    if "rain" in query_lower or "storm" in query_lower:
-        environmental_factors.append("adverse weather")
+    modifiers = [m for m in _MODIFIER_PHRASES if m in found["modifier"]]
+    environmental_factors = [f for f in _ENVIRONMENT_FACTORS if f in found["environment"]]
     
     return RuleQuery(
         action_type=action_type,
@@ -471,17 +545,28 @@ def parse_natural_language_query(query_text: str, context: Dict[str, Any] = None
         environmental_factors=environmental_factors if environmental_factors else None
     )
 
-def adjudicate_action(query_text: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
-    """Main function to adjudicate an action using the hybrid LLM + rule engine approach."""
-    
-    if context is None:
-        context = {}
+# Optional RuleResult fields copied into adjudicate_action responses, in output order
+_OPTIONAL_RESULT_FIELDS = (
+    "required_roll",
+    "dc",
+    "damage_formula",
+    "spell_slots_used",
+    "additional_effects",
+    "conditions_applied"
+)
+
+@functools.lru_cache(maxsize=1024)
+def _adjudicate_cached(query_text: str, character_level: Optional[int],
+                       character_class: Optional[str]) -> Dict[str, Any]:
+    """Adjudicate a query; pure in its arguments, so results are memoized."""
     
     # Step 1: Parse natural language into structured query (LLM front-end)
-    structured_query = parse_natural_language_query(query_text, context)
+    structured_query = parse_natural_language_query(
+        query_text, {"character_level": character_level, "character_class": character_class}
+    )
     
     # Step 2: Process with deterministic rule engine
-    rule_engine = DnD5eRuleEngine()
+    rule_engine = _RULE_ENGINE
     result = rule_engine.process_rule_query(structured_query)
     
     # Step 3: Format response for the Conductor
@@ -491,26 +576,36 @@ def adjudicate_action(query_text: str, context: Dict[str, Any] = None) -> Dict[s
         "structured_query": structured_query.to_dict()
     }
     
-    if result.required_roll:
-        response["required_roll"] = result.required_roll
-    if result.dc:
-        response["dc"] = result.dc
-    if result.damage_formula:
-        response["damage_formula"] = result.damage_formula
-    if result.spell_slots_used:
-        response["spell_slots_used"] = result.spell_slots_used
-    if result.additional_effects:
-        response["additional_effects"] = result.additional_effects
-    if result.conditions_applied:
-        response["conditions_applied"] = result.conditions_applied
+    # Include optional result fields only when they carry a value
+    for field_name in _OPTIONAL_RESULT_FIELDS:
+        value = getattr(result, field_name)
+        if value:
+            response[field_name] = value
     
     return response
 
-def validate_spell_casting(spell_name: str, character_class: str, character_level: int, 
-                          available_spell_slots: Dict[int, int] = None) -> Dict[str, Any]:
-    """Validate if a character can cast a specific spell."""
+def _fresh_copy(value: Any) -> Any:
+    """Copy the dicts and lists of a cached result so callers never mutate the cache."""
+    if isinstance(value, dict):
+        return {key: _fresh_copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_fresh_copy(item) for item in value]
+    return value
+
+def adjudicate_action(query_text: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Main function to adjudicate an action using the hybrid LLM + rule engine approach."""
+    
+    if context is None:
+        context = {}
     
-    rule_engine = DnD5eRuleEngine()
+    # Only the character's level and class influence the ruling
+    return _fresh_copy(_adjudicate_cached(
+        query_text, context.get("character_level"), context.get("character_class")
+    ))
+
+@functools.lru_cache(maxsize=256)
+def _spell_cast_result(spell_name: str, character_class: str, character_level: int) -> RuleResult:
+    """Run a spell casting query through the rule engine (memoized)."""
     
     # Create query for spell casting
     query = RuleQuery(
@@ -520,7 +615,13 @@ def validate_spell_casting(spell_name: str, character_class: str, character_leve
         character_level=character_level
     )
     
-    result = rule_engine.process_rule_query(query)
+    return _RULE_ENGINE.process_rule_query(query)
+
+def validate_spell_casting(spell_name: str, character_class: str, character_level: int, 
+                          available_spell_slots: Dict[int, int] = None) -> Dict[str, Any]:
+    """Validate if a character can cast a specific spell."""
+    
+    result = _spell_cast_result(spell_name, character_class, character_level)
     
     validation = {
         "can_cast": result.is_legal,
@@ -534,7 +635,7 @@ def validate_spell_casting(spell_name: str, character_class: str, character_leve
             validation["explanation"] += f" - No {spell_level}-level spell slots remaining"
     
     if result.additional_effects:
-        validation["spell_effects"] = result.additional_effects
+        validation["spell_effects"] = list(result.additional_effects)
     
     return validation
 
@@ -549,21 +650,11 @@ def calculate_difficulty_class(task_description: str, modifying_factors: List[st
         environmental_factors=modifying_factors
     )
     
-    rule_engine = DnD5eRuleEngine()
+    rule_engine = _RULE_ENGINE
     dc = rule_engine._calculate_dc(query)
     
     # Determine difficulty tier
-    difficulty_name = "Medium"
-    if dc <= 10:
-        difficulty_name = "Easy"
-    elif dc <= 15:
-        difficulty_name = "Medium"
-    elif dc <= 20:
-        difficulty_name = "Hard"
-    elif dc <= 25:
-        difficulty_name = "Very Hard"
-    else:
-        difficulty_name = "Nearly Impossible"
+    difficulty_name = _DC_TIER_NAMES[bisect.bisect_left(_DC_TIER_BOUNDS, dc)]
     
     return {
         "dc": dc,
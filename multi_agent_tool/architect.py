@@ -7,11 +7,12 @@ provide a satisfying level of challenge.
 """
 
 from google.adk.agents import Agent
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Final
 import random
-import math
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
 class EncounterType(Enum):
     COMBAT = "combat"
@@ -34,7 +35,14 @@ class PacingPhase(Enum):
     FALLING_ACTION = "falling_action"
     RESOLUTION = "resolution"
 
-@dataclass
+# Accept either enum members or their string values wherever an encounter type is passed in
+_ENCOUNTER_TYPE_LOOKUP = {**{t.value: t for t in EncounterType}, **{t: t for t in EncounterType}}
+
+def _as_encounter_type(value: Any) -> Optional[EncounterType]:
+    """Normalize an encounter type given as an enum member or its string value."""
+    return _ENCOUNTER_TYPE_LOOKUP.get(value)
+
+@dataclass(slots=True)
 class PartyComposition:
     """Represents the player party for encounter balancing."""
     size: int
@@ -70,11 +78,211 @@ CR_THRESHOLDS = {
     10: {"easy": 600, "medium": 1200, "hard": 1900, "deadly": 2800}
 }
 
+# CR_THRESHOLDS covers a contiguous level range, so out-of-range levels clamp
+_MIN_TABLE_LEVEL = min(CR_THRESHOLDS)
+_MAX_TABLE_LEVEL = max(CR_THRESHOLDS)
+
+# Suggested monster CR ranges keyed by (low offset, high offset) from party level, then level.
+# Only the support/minion ranges (low offset below -1) floor at CR 1.
+_CR_RANGES = {
+    (low, high): {
+        level: f"{max(1, level + low) if low < -1 else level + low} to {level + high}"
+        for level in CR_THRESHOLDS
+    }
+    for low, high in ((-1, 1), (-2, -1), (0, 2), (-3, -1))
+}
+
 MONSTER_CR_XP = {
     "1/8": 25, "1/4": 50, "1/2": 100, "1": 200, "2": 450, "3": 700,
     "4": 1100, "5": 1800, "6": 2300, "7": 2900, "8": 3900, "9": 5000, "10": 5900
 }
 
+# Encounter dressing tables (read-only; tuples so they can be sampled directly)
+ENVIRONMENTAL_FEATURES = MappingProxyType({
+    "dungeon": ("narrow corridors", "traps", "limited visibility", "difficult terrain"),
+    "wilderness": ("natural cover", "elevation changes", "environmental hazards", "weather effects"),
+    "urban": ("crowds", "buildings", "alleyways", "guard reinforcements"),
+    "magical": ("antimagic zones", "wild magic", "teleportation circles", "illusions")
+})
+
+TACTICAL_OPTIONS = (
+    "high ground advantage", "cover mechanics", "area denial effects",
+    "environmental hazards", "multiple objectives", "reinforcement waves",
+    "retreat opportunities", "crowd control elements"
+)
+
+SCALING_RECOMMENDATIONS = MappingProxyType({
+    "if_too_easy": (
+        "Add reinforcements mid-combat",
+        "Activate environmental hazards", 
+        "Have enemies use better tactics"
+    ),
+    "if_too_hard": (
+        "Reduce enemy hit points by 25%",
+        "Have some enemies retreat or flee",
+        "Introduce helpful environmental factors"
+    )
+})
+
+# Improvisation tables by encounter type
+IMPROVISED_CONTENT = MappingProxyType({
+    EncounterType.COMBAT: MappingProxyType({
+        "quick_enemies": (
+            "Bandits (adjust numbers based on party)",
+            "Wild animals native to the area", 
+            "Animated objects from the environment",
+            "Cultists of a local deity"
+        ),
+        "simple_tactics": (
+            "Enemies use environment for cover",
+            "Hit-and-run tactics with ranged attacks",
+            "Attempt to separate party members",
+            "Fight until reduced to half health, then flee"
+        ),
+        "motivation": "Territorial dispute, desperation, or mistaken identity"
+    }),
+    EncounterType.SOCIAL: MappingProxyType({
+        "npc_archetypes": (
+            "Traveling merchant with information",
+            "Local official with a problem",
+            "Mysterious stranger with a warning",
+            "Injured person needing help"
+        ),
+        "quick_motivations": (
+            "Seeking protection or assistance",
+            "Trading information for goods/services",
+            "Testing the party's character", 
+            "Delivering a message or warning"
+        ),
+        "conversation_hooks": (
+            "Recognizes one party member from somewhere",
+            "Has heard rumors about the party's deeds",
+            "Offers employment or partnership",
+            "Seeks to learn about party's destination"
+        )
+    }),
+    EncounterType.EXPLORATION: MappingProxyType({
+        "discoverable_locations": (
+            "Ancient ruins with historical significance",
+            "Hidden cave system",
+            "Abandoned settlement", 
+            "Natural landmark with local legends"
+        ),
+        "investigation_opportunities": (
+            "Strange tracks or signs of passage",
+            "Unusual magical phenomena",
+            "Evidence of recent conflict or activity",
+            "Hidden passages or secret doors"
+        ),
+        "environmental_storytelling": (
+            "Remnants that hint at past events",
+            "Natural formations that suggest danger",
+            "Signs of intelligent habitation",
+            "Magical or supernatural influences"
+        )
+    }),
+    EncounterType.PUZZLE: MappingProxyType({
+        "simple_puzzles": (
+            "Riddle blocking a doorway",
+            "Sequence pattern to activate mechanism",
+            "Weight/pressure plate combination",
+            "Symbol matching challenge"
+        ),
+        "skill_based_challenges": (
+            "Multiple skill checks with different approaches",
+            "Time pressure element",
+            "Teamwork requirement",
+            "Resource management component"
+        )
+    })
+})
+
+IMPROVISED_PREP_TIMES = MappingProxyType({
+    EncounterType.COMBAT: "2-5 minutes",
+    EncounterType.SOCIAL: "3-7 minutes",
+    EncounterType.EXPLORATION: "5-15 minutes",
+    EncounterType.PUZZLE: "7-12 minutes"
+})
+
+QUICK_IMPLEMENTATION_TIPS = (
+    "Use existing NPCs or monsters",
+    "Repurpose planned content for different context",
+    "Create simple binary choices",
+    "Focus on immediate, obvious consequences"
+)
+
+LOCATION_MODIFIERS = MappingProxyType({
+    "city": {"social": "+easy", "exploration": "+moderate"},
+    "wilderness": {"exploration": "+easy", "combat": "+moderate"}, 
+    "dungeon": {"combat": "+easy", "puzzle": "+moderate"},
+    "social_hub": {"social": "+very_easy", "combat": "-difficult"}
+})
+
+# Dynamic difficulty adjustment pools
+COMBAT_ASSISTANCE = (
+    "Reduce enemy hit points by 20-25%",
+    "Have an enemy miss a crucial attack", 
+    "Introduce helpful environmental factor",
+    "Have enemy make tactical error",
+    "Reduce number of enemies mid-encounter"
+)
+
+SOCIAL_ASSISTANCE = (
+    "NPC becomes more sympathetic to party",
+    "Reveal additional helpful information",
+    "Lower DC for persuasion attempts",
+    "Introduce friendly NPC ally"
+)
+
+COMBAT_ESCALATIONS = (
+    "Add reinforcements",
+    "Activate environmental hazards",
+    "Enemy uses more powerful abilities",
+    "Introduce additional objectives",
+    "Enemy retreats to more defensible position"
+)
+
+SOCIAL_ESCALATIONS = (
+    "NPC becomes more suspicious",
+    "Additional complications arise",
+    "Higher stakes introduced",
+    "Time pressure added"
+)
+
+MINOR_ADJUSTMENTS = (
+    "Add interesting tactical option",
+    "Introduce minor complication", 
+    "Provide additional narrative detail",
+    "Create opportunity for creative solution"
+)
+
+# Adjustment pool keyed by (party performance, is combat encounter)
+_ADJUSTMENT_POOLS = {
+    ("struggling", True): COMBAT_ASSISTANCE,
+    ("struggling", False): SOCIAL_ASSISTANCE,
+    ("dominating", True): COMBAT_ESCALATIONS,
+    ("dominating", False): SOCIAL_ESCALATIONS
+}
+
+# (reasoning, impact level) reported for each performance level
+_ADJUSTMENT_REASONS = {
+    "struggling": ("Party struggling - providing assistance", "moderate"),
+    "dominating": ("Party dominating - escalating challenge", "moderate")
+}
+_BALANCED_ADJUSTMENT_REASON = ("Maintaining balanced challenge level", "minor")
+
+IMPLEMENTATION_NOTES = MappingProxyType({
+    "subtle": (
+        "Make changes feel natural and story-driven",
+        "Don't announce mechanical adjustments",
+        "Integrate modifications into narrative flow"
+    ),
+    "obvious": (
+        "Changes can be more apparent to players",
+        "Focus on dramatic story reasons for adjustments"
+    )
+})
+
 def design_combat_encounter(party: PartyComposition, 
                           target_difficulty: EncounterDifficulty,
                           environment_type: str = "standard",
@@ -86,8 +294,7 @@ def design_combat_encounter(party: PartyComposition,
     
     # Calculate XP budget based on party size and level
     level = int(party.average_level)
-    if level not in CR_THRESHOLDS:
-        level = min(CR_THRESHOLDS.keys(), key=lambda x: abs(x - level))
+    level = _MIN_TABLE_LEVEL if level < _MIN_TABLE_LEVEL else _MAX_TABLE_LEVEL if level > _MAX_TABLE_LEVEL else level
     
     base_xp = CR_THRESHOLDS[level][target_difficulty.value]
     party_xp_budget = base_xp * party.size
@@ -113,71 +320,61 @@ def design_combat_encounter(party: PartyComposition,
     if party.size <= 3:
         # Smaller parties: fewer, stronger monsters
         encounter_design["suggested_monsters"] = [
-            {"role": "primary threat", "cr_range": f"{level-1} to {level+1}", "count": 1},
-            {"role": "support", "cr_range": f"{max(1, level-2)} to {level-1}", "count": "1-2"}
+            {"role": "primary threat", "cr_range": _CR_RANGES[-1, 1][level], "count": 1},
+            {"role": "support", "cr_range": _CR_RANGES[-2, -1][level], "count": "1-2"}
         ]
         encounter_design["encounter_multiplier"] = 1.0
     elif party.size <= 5:
         # Standard parties: balanced mix
         encounter_design["suggested_monsters"] = [
-            {"role": "boss", "cr_range": f"{level} to {level+2}", "count": 1},
-            {"role": "minions", "cr_range": f"{max(1, level-3)} to {level-1}", "count": "2-4"}
+            {"role": "boss", "cr_range": _CR_RANGES[0, 2][level], "count": 1},
+            {"role": "minions", "cr_range": _CR_RANGES[-3, -1][level], "count": "2-4"}
         ]
         encounter_design["encounter_multiplier"] = 1.5
     else:
         # Large parties: more numerous enemies
         encounter_design["suggested_monsters"] = [
-            {"role": "elite", "cr_range": f"{level-1} to {level+1}", "count": "2-3"},
-            {"role": "minions", "cr_range": f"{max(1, level-3)} to {level-1}", "count": "4-6"}
+            {"role": "elite", "cr_range": _CR_RANGES[-1, 1][level], "count": "2-3"},
+            {"role": "minions", "cr_range": _CR_RANGES[-3, -1][level], "count": "4-6"}
         ]
         encounter_design["encounter_multiplier"] = 2.0
     
     # Add environmental features based on environment type
-    environmental_features = {
-        "dungeon": ["narrow corridors", "traps", "limited visibility", "difficult terrain"],
-        "wilderness": ["natural cover", "elevation changes", "environmental hazards", "weather effects"],
-        "urban": ["crowds", "buildings", "alleyways", "guard reinforcements"],
-        "magical": ["antimagic zones", "wild magic", "teleportation circles", "illusions"]
-    }
-    
-    if environment_type in environmental_features:
+    if environment_type in ENVIRONMENTAL_FEATURES:
         encounter_design["environmental_features"] = random.sample(
-            environmental_features[environment_type], 
+            ENVIRONMENTAL_FEATURES[environment_type], 
             random.randint(1, 3)
         )
     
     # Add tactical elements to make combat interesting
-    tactical_options = [
-        "high ground advantage", "cover mechanics", "area denial effects",
-        "environmental hazards", "multiple objectives", "reinforcement waves",
-        "retreat opportunities", "crowd control elements"
-    ]
-    
-    encounter_design["tactical_elements"] = random.sample(tactical_options, random.randint(2, 4))
+    encounter_design["tactical_elements"] = random.sample(TACTICAL_OPTIONS, random.randint(2, 4))
     
     # Scaling recommendations for dynamic difficulty
-    encounter_design["scaling_recommendations"] = {
-        "if_too_easy": [
-            "Add reinforcements mid-combat",
-            "Activate environmental hazards", 
-            "Have enemies use better tactics"
-        ],
-        "if_too_hard": [
-            "Reduce enemy hit points by 25%",
-            "Have some enemies retreat or flee",
-            "Introduce helpful environmental factors"
-        ]
-    }
+    encounter_design["scaling_recommendations"] = dict(SCALING_RECOMMENDATIONS)
     
     return encounter_design
 
+# Session phase keyed by (combat-heavy, social-heavy, has rested); combat outranks social outranks rest
+_PACING_PHASE_TABLE = {
+    (combat_heavy, social_heavy, has_rest): (
+        PacingPhase.CLIMAX if combat_heavy
+        else PacingPhase.RISING_ACTION if social_heavy
+        else PacingPhase.FALLING_ACTION if has_rest
+        else PacingPhase.SETUP
+    )
+    for combat_heavy in (False, True)
+    for social_heavy in (False, True)
+    for has_rest in (False, True)
+}
+
 def assess_pacing_needs(session_events: List[Dict[str, Any]], 
                        session_duration: int,
                        party_energy_level: str = "medium") -> Dict[str, Any]:
     """Assess current pacing and recommend adjustments."""
     
     # Analyze recent events for pacing patterns
-    event_types = [event.get("type", "unknown") for event in session_events[-10:]]  # Last 10 events
+    recent_events = session_events[-10:]  # Last 10 events
+    counts = Counter(event.get("type", "unknown") for event in recent_events)
     
     pacing_analysis = {
         "current_phase": PacingPhase.SETUP,
@@ -189,29 +386,26 @@ def assess_pacing_needs(session_events: List[Dict[str, Any]],
     }
     
     # Count event types
-    for event_type in ["combat", "social", "exploration", "puzzle", "rest"]:
-        pacing_analysis["event_distribution"][event_type] = event_types.count(event_type)
+    for event_type in ("combat", "social", "exploration", "puzzle", "rest"):
+        pacing_analysis["event_distribution"][event_type] = counts[event_type]
     
-    total_events = len(event_types)
+    total_events = len(recent_events)
     if total_events == 0:
         pacing_analysis["current_phase"] = PacingPhase.SETUP
         pacing_analysis["recommendations"].append("Begin with exploration or social encounter to establish scene")
         return pacing_analysis
     
     # Determine current phase based on event patterns
-    combat_ratio = event_types.count("combat") / total_events
-    social_ratio = event_types.count("social") / total_events
-    
-    if combat_ratio > 0.5:
-        pacing_analysis["current_phase"] = PacingPhase.CLIMAX
-    elif social_ratio > 0.4:
-        pacing_analysis["current_phase"] = PacingPhase.RISING_ACTION
-    elif event_types.count("rest") > 0:
-        pacing_analysis["current_phase"] = PacingPhase.FALLING_ACTION
+    combat_ratio = counts["combat"] / total_events
+    social_ratio = counts["social"] / total_events
+    
+    pacing_analysis["current_phase"] = _PACING_PHASE_TABLE[
+        combat_ratio > 0.5, social_ratio > 0.4, counts["rest"] > 0
+    ]
     
     # Analyze pacing issues and make recommendations
-    recent_combat = any(event_type == "combat" for event_type in event_types[-3:])
-    recent_social = any(event_type == "social" for event_type in event_types[-3:])
+    recent_types = {event.get("type", "unknown") for event in recent_events[-3:]}
+    recent_social = "social" in recent_types
     
     if combat_ratio > 0.6:
         pacing_analysis["recommendations"].append("Too much combat - introduce social or exploration elements")
@@ -225,7 +419,7 @@ def assess_pacing_needs(session_events: List[Dict[str, Any]],
     if not recent_social and total_events > 3:
         pacing_analysis["recommendations"].append("Add character development or NPC interaction")
     
-    if event_types.count("exploration") < 2 and total_events > 5:
+    if counts["exploration"] < 2 and total_events > 5:
         pacing_analysis["recommendations"].append("Include more world-building and discovery elements")
     
     # Energy level considerations
@@ -263,114 +457,23 @@ def generate_improvised_content(content_type: EncounterType,
         "prep_time_needed": "5-10 minutes"
     }
     
-    if content_type == EncounterType.COMBAT:
-        improvised_content["content"] = {
-            "quick_enemies": [
-                "Bandits (adjust numbers based on party)",
-                "Wild animals native to the area", 
-                "Animated objects from the environment",
-                "Cultists of a local deity"
-            ],
-            "simple_tactics": [
-                "Enemies use environment for cover",
-                "Hit-and-run tactics with ranged attacks",
-                "Attempt to separate party members",
-                "Fight until reduced to half health, then flee"
-            ],
-            "motivation": "Territorial dispute, desperation, or mistaken identity"
-        }
-        improvised_content["prep_time_needed"] = "2-5 minutes"
-    
-    elif content_type == EncounterType.SOCIAL:
-        improvised_content["content"] = {
-            "npc_archetypes": [
-                "Traveling merchant with information",
-                "Local official with a problem",
-                "Mysterious stranger with a warning",
-                "Injured person needing help"
-            ],
-            "quick_motivations": [
-                "Seeking protection or assistance",
-                "Trading information for goods/services",
-                "Testing the party's character", 
-                "Delivering a message or warning"
-            ],
-            "conversation_hooks": [
-                "Recognizes one party member from somewhere",
-                "Has heard rumors about the party's deeds",
-                "Offers employment or partnership",
-                "Seeks to learn about party's destination"
-            ]
-        }
-        improvised_content["prep_time_needed"] = "3-7 minutes"
-    
-    elif content_type == EncounterType.EXPLORATION:
-        improvised_content["content"] = {
-            "discoverable_locations": [
-                "Ancient ruins with historical significance",
-                "Hidden cave system",
-                "Abandoned settlement", 
-                "Natural landmark with local legends"
-            ],
-            "investigation_opportunities": [
-                "Strange tracks or signs of passage",
-                "Unusual magical phenomena",
-                "Evidence of recent conflict or activity",
-                "Hidden passages or secret doors"
-            ],
-            "environmental_storytelling": [
-                "Remnants that hint at past events",
-                "Natural formations that suggest danger",
-                "Signs of intelligent habitation",
-                "Magical or supernatural influences"
-            ]
-        }
-        improvised_content["prep_time_needed"] = "5-15 minutes"
-    
-    elif content_type == EncounterType.PUZZLE:
-        improvised_content["content"] = {
-            "simple_puzzles": [
-                "Riddle blocking a doorway",
-                "Sequence pattern to activate mechanism",
-                "Weight/pressure plate combination",
-                "Symbol matching challenge"
-            ],
-            "skill_based_challenges": [
-                "Multiple skill checks with different approaches",
-                "Time pressure element",
-                "Teamwork requirement",
-                "Resource management component"
-            ]
-        }
-        improvised_content["prep_time_needed"] = "7-12 minutes"
+    if content_type in IMPROVISED_CONTENT:
+        improvised_content["content"] = dict(IMPROVISED_CONTENT[content_type])
+        improvised_content["prep_time_needed"] = IMPROVISED_PREP_TIMES[content_type]
     
     # Adjust for urgency
     if urgency == "high":
         improvised_content["prep_time_needed"] = "1-3 minutes"
         improvised_content["implementation_difficulty"] = "simple"
-        improvised_content["content"]["quick_implementation"] = [
-            "Use existing NPCs or monsters",
-            "Repurpose planned content for different context",
-            "Create simple binary choices",
-            "Focus on immediate, obvious consequences"
-        ]
+        improvised_content["content"]["quick_implementation"] = QUICK_IMPLEMENTATION_TIPS
     
     # Location-specific adjustments
-    location_modifiers = {
-        "city": {"social": "+easy", "exploration": "+moderate"},
-        "wilderness": {"exploration": "+easy", "combat": "+moderate"}, 
-        "dungeon": {"combat": "+easy", "puzzle": "+moderate"},
-        "social_hub": {"social": "+very_easy", "combat": "-difficult"}
-    }
-    
-    if party_location in location_modifiers:
-        modifiers = location_modifiers[party_location]
-        for encounter_type, difficulty_mod in modifiers.items():
-            if encounter_type == content_type.value:
-                if "easy" in difficulty_mod:
-                    improvised_content["implementation_difficulty"] = "easy"
-                elif "difficult" in difficulty_mod:
-                    improvised_content["implementation_difficulty"] = "difficult"
+    difficulty_mod = LOCATION_MODIFIERS.get(party_location, {}).get(content_type.value)
+    if difficulty_mod is not None:
+        if "easy" in difficulty_mod:
+            improvised_content["implementation_difficulty"] = "easy"
+        elif "difficult" in difficulty_mod:
+            improvised_content["implementation_difficulty"] = "difficult"
     
     return improvised_content
 
@@ -379,98 +482,32 @@ def adjust_dynamic_difficulty(current_encounter: Dict[str, Any],
                             adjustment_type: str = "subtle") -> Dict[str, Any]:
     """Dynamically adjust encounter difficulty based on party performance."""
     
-    adjustments = {
-        "modifications_applied": [],
-        "reasoning": [],
-        "visibility": adjustment_type,
-        "impact_level": "minor"
-    }
-    
-    if party_performance == "struggling":
-        # Make encounter easier
-        combat_adjustments = [
-            "Reduce enemy hit points by 20-25%",
-            "Have an enemy miss a crucial attack", 
-            "Introduce helpful environmental factor",
-            "Have enemy make tactical error",
-            "Reduce number of enemies mid-encounter"
-        ]
-        
-        social_adjustments = [
-            "NPC becomes more sympathetic to party",
-            "Reveal additional helpful information",
-            "Lower DC for persuasion attempts",
-            "Introduce friendly NPC ally"
-        ]
-        
-        if current_encounter.get("type") == "combat":
-            selected_adjustments = random.sample(combat_adjustments, 2)
-        else:
-            selected_adjustments = random.sample(social_adjustments, 2)
-        
-        adjustments["modifications_applied"] = selected_adjustments
-        adjustments["reasoning"].append("Party struggling - providing assistance")
-        adjustments["impact_level"] = "moderate"
-    
-    elif party_performance == "dominating":
-        # Make encounter harder
-        combat_escalations = [
-            "Add reinforcements",
-            "Activate environmental hazards",
-            "Enemy uses more powerful abilities",
-            "Introduce additional objectives",
-            "Enemy retreats to more defensible position"
-        ]
-        
-        social_escalations = [
-            "NPC becomes more suspicious",
-            "Additional complications arise",
-            "Higher stakes introduced",
-            "Time pressure added"
-        ]
-        
-        if current_encounter.get("type") == "combat":
-            selected_adjustments = random.sample(combat_escalations, 2)
-        else:
-            selected_adjustments = random.sample(social_escalations, 2)
-        
-        adjustments["modifications_applied"] = selected_adjustments
-        adjustments["reasoning"].append("Party dominating - escalating challenge")
-        adjustments["impact_level"] = "moderate"
+    is_combat = _as_encounter_type(current_encounter.get("type")) is EncounterType.COMBAT
+    pool = _ADJUSTMENT_POOLS.get((party_performance, is_combat))
     
+    if pool is not None:
+        # Struggling parties get assistance, dominating parties get escalation
+        modifications = random.sample(pool, 2)
+        reason, impact_level = _ADJUSTMENT_REASONS[party_performance]
     else:  # balanced performance
         # Minor tweaks to maintain engagement
-        minor_adjustments = [
-            "Add interesting tactical option",
-            "Introduce minor complication", 
-            "Provide additional narrative detail",
-            "Create opportunity for creative solution"
-        ]
-        
-        adjustments["modifications_applied"] = random.sample(minor_adjustments, 1)
-        adjustments["reasoning"].append("Maintaining balanced challenge level")
-        adjustments["impact_level"] = "minor"
+        modifications = random.sample(MINOR_ADJUSTMENTS, 1)
+        reason, impact_level = _BALANCED_ADJUSTMENT_REASON
+    
+    adjustments = {
+        "modifications_applied": modifications,
+        "reasoning": [reason],
+        "visibility": adjustment_type,
+        "impact_level": impact_level
+    }
     
     # Adjust visibility based on type
-    if adjustment_type == "subtle":
-        adjustments["implementation_notes"] = [
-            "Make changes feel natural and story-driven",
-            "Don't announce mechanical adjustments",
-            "Integrate modifications into narrative flow"
-        ]
-    elif adjustment_type == "obvious":
-        adjustments["implementation_notes"] = [
-            "Changes can be more apparent to players",
-            "Focus on dramatic story reasons for adjustments"
-        ]
+    if adjustment_type in IMPLEMENTATION_NOTES:
+        adjustments["implementation_notes"] = IMPLEMENTATION_NOTES[adjustment_type]
     
     return adjustments
 
-architect_agent = Agent(
-    name="architect",
-    model="gemini-2.0-flash",
-    description="The Architect designs encounters, manages pacing, provides improvisation support, and dynamically adjusts difficulty to maintain engagement.",
-    instruction="""You are the Architect, the designer of challenges that test the heroes and the controller of the adventure's rhythm. Your role is to craft engaging encounters and manage the flow of the game to ensure optimal player engagement. Your responsibilities include:
+ARCHITECT_INSTRUCTION: Final[str] = """You are the Architect, the designer of challenges that test the heroes and the controller of the adventure's rhythm. Your role is to craft engaging encounters and manage the flow of the game to ensure optimal player engagement. Your responsibilities include:
 
 1. **Encounter Design**: Create balanced, engaging encounters:
    - Design combat encounters using proper CR calculations
@@ -502,6 +539,12 @@ Use the provided tools to:
 - Generate improvised content when players take unexpected actions
 - Adjust encounter difficulty dynamically based on performance
 
-Remember: Your goal is engagement, not victory or defeat. Every encounter should feel challenging but fair, every session should have proper pacing with peaks and valleys, and players should always feel their choices matter. You are the invisible hand that guides the adventure's intensity and ensures everyone has fun.""",
+Remember: Your goal is engagement, not victory or defeat. Every encounter should feel challenging but fair, every session should have proper pacing with peaks and valleys, and players should always feel their choices matter. You are the invisible hand that guides the adventure's intensity and ensures everyone has fun."""
+
+architect_agent = Agent(
+    name="architect",
+    model="gemini-2.0-flash",
+    description="The Architect designs encounters, manages pacing, provides improvisation support, and dynamically adjusts difficulty to maintain engagement.",
+    instruction=ARCHITECT_INSTRUCTION,
     tools=[design_combat_encounter, assess_pacing_needs, generate_improvised_content, adjust_dynamic_difficulty]
 )
\ No newline at end of file
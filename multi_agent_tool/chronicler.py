@@ -6,9 +6,12 @@ characters, and the outcomes of actions, creating an immersive experience for pl
 """
 
 from google.adk.agents import Agent
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+import functools
 import random
+import re
 from enum import Enum
+from types import MappingProxyType
 
 class AtmosphereType(Enum):
     PEACEFUL = "peaceful"
@@ -31,6 +34,157 @@ class DescriptionType(Enum):
     COMBAT = "combat"
     SPELL_EFFECT = "spell_effect"
 
+# Module-local generator: skips the shared module-level random instance on every draw
+_RNG = random.Random()
+_choice = _RNG.choice
+
+# Base sensory vocabularies by atmosphere
+_ATMOSPHERE_DESCRIPTORS = MappingProxyType({
+    AtmosphereType.PEACEFUL: MappingProxyType({
+        "sight": ("gentle", "warm", "golden", "soft", "serene", "clear"),
+        "sound": ("whisper", "rustle", "gentle", "distant", "melodic", "soft"),
+        "smell": ("fresh", "clean", "floral", "sweet", "crisp"),
+        "touch": ("warm", "smooth", "comfortable", "gentle"),
+        "taste": ("clean", "refreshing", "pleasant")
+    }),
+    AtmosphereType.TENSE: MappingProxyType({
+        "sight": ("sharp", "stark", "contrasting", "focused", "intense"),
+        "sound": ("silence", "creak", "distant", "muffled", "sharp"),
+        "smell": ("metallic", "stale", "acrid", "musty"),
+        "touch": ("cold", "rough", "tight", "constricting"),
+        "taste": ("bitter", "dry", "metallic")
+    }),
+    AtmosphereType.MYSTERIOUS: MappingProxyType({
+        "sight": ("shadowy", "veiled", "dim", "obscured", "flickering", "elusive"),
+        "sound": ("echo", "whisper", "distant", "muffled", "strange"),
+        "smell": ("ancient", "dusty", "exotic", "unknown", "faint"),
+        "touch": ("cool", "smooth", "unexpected", "strange"),
+        "taste": ("unusual", "lingering", "complex")
+    }),
+    AtmosphereType.OMINOUS: MappingProxyType({
+        "sight": ("dark", "looming", "twisted", "jagged", "threatening"),
+        "sound": ("growl", "scrape", "howl", "thunder", "ominous"),
+        "smell": ("decay", "sulfur", "blood", "rot", "acrid"),
+        "touch": ("cold", "slimy", "sharp", "burning"),
+        "taste": ("bitter", "foul", "copper", "ash")
+    })
+})
+
+_LIGHT_VERBS = ('filters through', 'illuminates', 'casts shadows across', 'reveals')
+
+_COMBAT_SIGHTS = (
+    "Steel flashes in the light",
+    "Movement blur as combat intensifies"
+)
+_COMBAT_SOUNDS = (
+    "The clash of weapons rings out",
+    "Shouts and battle cries fill the air"
+)
+_BLOODY_ATMOSPHERES = frozenset({AtmosphereType.OMINOUS, AtmosphereType.CHAOTIC})
+
+# Scene openings by atmosphere; str.format templates filled with location_name
+_ATMOSPHERE_OPENINGS = MappingProxyType({
+    AtmosphereType.PEACEFUL: (
+        "The {location_name} welcomes you with its serene presence.",
+        "A sense of calm pervades the {location_name}.",
+        "The {location_name} stretches before you, peaceful and inviting."
+    ),
+    AtmosphereType.MYSTERIOUS: (
+        "The {location_name} holds its secrets close, shrouded in mystery.",
+        "An air of enigma surrounds the {location_name}.",
+        "The {location_name} whispers of hidden truths and ancient mysteries."
+    ),
+    AtmosphereType.OMINOUS: (
+        "The {location_name} looms before you, heavy with foreboding.",
+        "A sense of dread emanates from the {location_name}.",
+        "The {location_name} seems to watch you with malevolent intent."
+    )
+})
+
+# Environmental context by time of day and weather
+_TIME_DESCRIPTIONS = MappingProxyType({
+    "dawn": "The early morning light bathes everything in soft, golden hues.",
+    "day": "Daylight illuminates the area clearly, revealing fine details.",
+    "dusk": "The fading light of evening creates long shadows and warm colors.",
+    "night": "Darkness envelops the area, with only limited light revealing shapes and silhouettes."
+})
+
+_WEATHER_DESCRIPTIONS = MappingProxyType({
+    "rain": "Rain patters against surfaces, creating a rhythmic soundtrack and fresh, clean smells.",
+    "fog": "Thick fog reduces visibility, muffling sounds and creating an ethereal atmosphere.",
+    "wind": "Wind stirs the air, carrying scents from distant places and adding movement to the scene.",
+    "storm": "Storm clouds gather overhead, with distant thunder promising dramatic weather ahead."
+})
+
+_ATTACK_FAILURE_DESCRIPTIONS = (
+    "Your weapon passes harmlessly by your target, finding only empty air.",
+    "The timing is off, and your attack fails to connect meaningfully.",
+    "Your opponent's defenses prove superior, turning aside your assault."
+)
+
+# Action narration categories in priority order, matched against whole words, so each
+# verb lists its -s, past and -ing forms (the same policy as adjudicator's word tables)
+_WORD_RE = re.compile(r"[a-z]+")
+_ACTION_CATEGORY_WORDS = (
+    ("attack", frozenset({"attack", "attacks", "attacked", "attacking", "strike", "strikes", "struck",
+                          "striking", "hit", "hits", "hitting", "slash", "slashes", "slashed", "slashing",
+                          "stab", "stabs", "stabbed", "stabbing"})),
+    ("spell", frozenset({"cast", "casts", "casting", "spell", "spells", "magic", "magical"})),
+    ("stealth", frozenset({"sneak", "sneaks", "sneaked", "snuck", "sneaking", "hide", "hides", "hid",
+                           "hidden", "hiding", "stealth", "stealthily"})),
+    ("athletics", frozenset({"jump", "jumps", "jumped", "jumping", "climb", "climbs", "climbed", "climbing",
+                             "acrobat", "acrobatic", "acrobatics"})),
+    ("social", frozenset({"persuade", "persuades", "persuaded", "persuading", "convince", "convinces",
+                          "convinced", "convincing", "talk", "talks", "talked", "talking"}))
+)
+
+# Environmental context words that colour an action's outcome
+_FOOTING_WORDS = frozenset({"slippery"})
+_WEATHER_WORDS = frozenset({"windy", "storm", "storms", "stormy"})
+_DARKNESS_WORDS = frozenset({"darkness"})
+
+# Atmosphere transitions and location defaults
+_ATMOSPHERE_TRANSITIONS = MappingProxyType({
+    AtmosphereType.PEACEFUL: {
+        "escalation": AtmosphereType.TENSE,
+        "mystery": AtmosphereType.MYSTERIOUS,
+        "danger": AtmosphereType.OMINOUS
+    },
+    AtmosphereType.TENSE: {
+        "combat": AtmosphereType.CHAOTIC,
+        "resolution": AtmosphereType.PEACEFUL,
+        "mystery": AtmosphereType.MYSTERIOUS
+    },
+    AtmosphereType.MYSTERIOUS: {
+        "revelation": AtmosphereType.TRIUMPHANT,
+        "danger": AtmosphereType.OMINOUS,
+        "peace": AtmosphereType.PEACEFUL
+    }
+})
+
+# Event keywords that push the atmosphere, one named group per cue
+_ATMOSPHERE_TRIGGERS = {
+    "combat": ("combat", "attack", "battle", "fight"),
+    "discovery": ("discovery", "found", "revealed", "uncovered"),
+    "reward": ("treasure", "reward"),
+    "loss": ("death", "killed", "destroyed", "lost")
+}
+_ATMOSPHERE_TRIGGER_RE = re.compile("|".join(
+    f"(?P<{cue}>{'|'.join(words)})" for cue, words in _ATMOSPHERE_TRIGGERS.items()
+), re.IGNORECASE)
+
+# Membership-checked mood lookup, avoiding the ValueError path of AtmosphereType(value)
+_ATMOSPHERES_BY_VALUE = MappingProxyType({atmosphere.value: atmosphere for atmosphere in AtmosphereType})
+
+_LOCATION_ATMOSPHERES = MappingProxyType({
+    "dungeon": AtmosphereType.OMINOUS,
+    "temple": AtmosphereType.SACRED,
+    "tavern": AtmosphereType.COZY,
+    "wilderness": AtmosphereType.PEACEFUL,
+    "ruins": AtmosphereType.MYSTERIOUS,
+    "battlefield": AtmosphereType.CHAOTIC
+})
+
 def generate_sensory_details(description_type: DescriptionType, 
                            base_description: str,
                            atmosphere: AtmosphereType = AtmosphereType.PEACEFUL,
@@ -48,81 +202,43 @@ def generate_sensory_details(description_type: DescriptionType,
         "taste": []
     }
     
-    # Base sensory vocabularies by atmosphere
-    atmosphere_descriptors = {
-        AtmosphereType.PEACEFUL: {
-            "sight": ["gentle", "warm", "golden", "soft", "serene", "clear"],
-            "sound": ["whisper", "rustle", "gentle", "distant", "melodic", "soft"],
-            "smell": ["fresh", "clean", "floral", "sweet", "crisp"],
-            "touch": ["warm", "smooth", "comfortable", "gentle"],
-            "taste": ["clean", "refreshing", "pleasant"]
-        },
-        AtmosphereType.TENSE: {
-            "sight": ["sharp", "stark", "contrasting", "focused", "intense"],
-            "sound": ["silence", "creak", "distant", "muffled", "sharp"],
-            "smell": ["metallic", "stale", "acrid", "musty"],
-            "touch": ["cold", "rough", "tight", "constricting"],
-            "taste": ["bitter", "dry", "metallic"]
-        },
-        AtmosphereType.MYSTERIOUS: {
-            "sight": ["shadowy", "veiled", "dim", "obscured", "flickering", "elusive"],
-            "sound": ["echo", "whisper", "distant", "muffled", "strange"],
-            "smell": ["ancient", "dusty", "exotic", "unknown", "faint"],
-            "touch": ["cool", "smooth", "unexpected", "strange"],
-            "taste": ["unusual", "lingering", "complex"]
-        },
-        AtmosphereType.OMINOUS: {
-            "sight": ["dark", "looming", "twisted", "jagged", "threatening"],
-            "sound": ["growl", "scrape", "howl", "thunder", "ominous"],
-            "smell": ["decay", "sulfur", "blood", "rot", "acrid"],
-            "touch": ["cold", "slimy", "sharp", "burning"],
-            "taste": ["bitter", "foul", "copper", "ash"]
-        }
-    }
-    
     # Get descriptors for current atmosphere
-    descriptors = atmosphere_descriptors.get(atmosphere, atmosphere_descriptors[AtmosphereType.PEACEFUL])
+    descriptors = _ATMOSPHERE_DESCRIPTORS.get(atmosphere, _ATMOSPHERE_DESCRIPTORS[AtmosphereType.PEACEFUL])
     
     # Generate sensory details based on description type
     if description_type == DescriptionType.LOCATION:
         if "sight" in emphasis_senses:
             sensory_elements["sight"] = [
-                f"The space is {random.choice(descriptors['sight'])} and {random.choice(descriptors['sight'])}",
-                f"Light {random.choice(['filters through', 'illuminates', 'casts shadows across', 'reveals'])} the area"
+                f"The space is {_choice(descriptors['sight'])} and {_choice(descriptors['sight'])}",
+                f"Light {_choice(_LIGHT_VERBS)} the area"
             ]
         
         if "sound" in emphasis_senses:
             sensory_elements["sound"] = [
-                f"You hear the {random.choice(descriptors['sound'])} sounds of the environment",
-                f"A {random.choice(descriptors['sound'])} noise echoes faintly"
+                f"You hear the {_choice(descriptors['sound'])} sounds of the environment",
+                f"A {_choice(descriptors['sound'])} noise echoes faintly"
             ]
         
         if "smell" in emphasis_senses:
             sensory_elements["smell"] = [
-                f"The air carries a {random.choice(descriptors['smell'])} scent"
+                f"The air carries a {_choice(descriptors['smell'])} scent"
             ]
     
     elif description_type == DescriptionType.ACTION_RESULT:
         if "sight" in emphasis_senses:
             sensory_elements["sight"] = [
-                f"You see the {random.choice(descriptors['sight'])} result of your action"
+                f"You see the {_choice(descriptors['sight'])} result of your action"
             ]
         
         if "sound" in emphasis_senses:
             sensory_elements["sound"] = [
-                f"The action produces a {random.choice(descriptors['sound'])} sound"
+                f"The action produces a {_choice(descriptors['sound'])} sound"
             ]
     
     elif description_type == DescriptionType.COMBAT:
-        sensory_elements["sight"] = [
-            "Steel flashes in the light",
-            "Movement blur as combat intensifies"
-        ]
-        sensory_elements["sound"] = [
-            "The clash of weapons rings out",
-            "Shouts and battle cries fill the air"
-        ]
-        if atmosphere in [AtmosphereType.OMINOUS, AtmosphereType.CHAOTIC]:
+        sensory_elements["sight"] = list(_COMBAT_SIGHTS)
+        sensory_elements["sound"] = list(_COMBAT_SOUNDS)
+        if atmosphere in _BLOODY_ATMOSPHERES:
             sensory_elements["smell"].append("The metallic scent of blood")
     
     return {
@@ -142,37 +258,31 @@ def describe_scene(location_name: str,
     if previous_events is None:
         previous_events = []
     
-    # Start with base location description
-    description_parts = []
+    # Opening with atmosphere (drawn per call so revisited scenes still vary)
+    openings = _ATMOSPHERE_OPENINGS.get(atmosphere, _ATMOSPHERE_OPENINGS[AtmosphereType.PEACEFUL])
+    opening = _choice(openings).format(location_name=location_name)
     
-    # Opening with atmosphere
-    atmosphere_openings = {
-        AtmosphereType.PEACEFUL: [
-            f"The {location_name} welcomes you with its serene presence.",
-            f"A sense of calm pervades the {location_name}.",
-            f"The {location_name} stretches before you, peaceful and inviting."
-        ],
-        AtmosphereType.MYSTERIOUS: [
-            f"The {location_name} holds its secrets close, shrouded in mystery.",
-            f"An air of enigma surrounds the {location_name}.",
-            f"The {location_name} whispers of hidden truths and ancient mysteries."
-        ],
-        AtmosphereType.OMINOUS: [
-            f"The {location_name} looms before you, heavy with foreboding.",
-            f"A sense of dread emanates from the {location_name}.",
-            f"The {location_name} seems to watch you with malevolent intent."
-        ]
-    }
+    # Everything after the opening depends only on these inputs, so it is cached
+    recent_event = previous_events[-1] if previous_events else ""
+    scene_body = _describe_scene_body(atmosphere, tuple(key_features[:3]) if key_features else (),
+                                      time_of_day, weather, recent_event)
+    
+    return " ".join((opening, *scene_body))
+
+@functools.lru_cache(maxsize=512)
+def _describe_scene_body(atmosphere: AtmosphereType,
+                         key_features: Tuple[str, ...],
+                         time_of_day: str,
+                         weather: str,
+                         recent_event: str) -> Tuple[str, ...]:
+    """Build the deterministic feature, environment and event sentences of a scene."""
     
-    opening = random.choice(atmosphere_openings.get(atmosphere, atmosphere_openings[AtmosphereType.PEACEFUL]))
-    description_parts.append(opening)
+    description_parts = []
     
-    # Add key features with sensory details
+    # Add key features
     if key_features:
         feature_descriptions = []
-        for feature in key_features[:3]:  # Limit to avoid overwhelming
-            sensory_info = generate_sensory_details(DescriptionType.LOCATION, feature, atmosphere)
-            
+        for feature in key_features:  # Already limited to 3 to avoid overwhelming
             # Create rich feature description
             if atmosphere == AtmosphereType.MYSTERIOUS:
                 feature_descriptions.append(f"Through the dim light, you make out {feature}, its details obscured by shadow and uncertainty.")
@@ -188,39 +298,24 @@ def describe_scene(location_name: str,
     environmental_details = []
     
     # Time of day influence
-    time_descriptions = {
-        "dawn": "The early morning light bathes everything in soft, golden hues.",
-        "day": "Daylight illuminates the area clearly, revealing fine details.",
-        "dusk": "The fading light of evening creates long shadows and warm colors.",
-        "night": "Darkness envelops the area, with only limited light revealing shapes and silhouettes."
-    }
-    
-    if time_of_day in time_descriptions:
-        environmental_details.append(time_descriptions[time_of_day])
+    if time_of_day in _TIME_DESCRIPTIONS:
+        environmental_details.append(_TIME_DESCRIPTIONS[time_of_day])
     
     # Weather influence
-    weather_descriptions = {
-        "rain": "Rain patters against surfaces, creating a rhythmic soundtrack and fresh, clean smells.",
-        "fog": "Thick fog reduces visibility, muffling sounds and creating an ethereal atmosphere.",
-        "wind": "Wind stirs the air, carrying scents from distant places and adding movement to the scene.",
-        "storm": "Storm clouds gather overhead, with distant thunder promising dramatic weather ahead."
-    }
-    
-    if weather in weather_descriptions:
-        environmental_details.append(weather_descriptions[weather])
+    if weather in _WEATHER_DESCRIPTIONS:
+        environmental_details.append(_WEATHER_DESCRIPTIONS[weather])
     
     if environmental_details:
         description_parts.append(" ".join(environmental_details))
     
     # Reference previous events if relevant
-    if previous_events:
-        recent_event = previous_events[-1] if previous_events else ""
-        if recent_event and any(word in recent_event.lower() for word in ["battle", "fight", "combat"]):
+    if recent_event:
+        if any(word in recent_event.lower() for word in ["battle", "fight", "combat"]):
             description_parts.append("Signs of the recent conflict are still visible, adding tension to the atmosphere.")
-        elif recent_event and "discovery" in recent_event.lower():
+        elif "discovery" in recent_event.lower():
             description_parts.append("The recent discovery has changed how you view this place, adding new significance to familiar sights.")
     
-    return " ".join(description_parts)
+    return tuple(description_parts)
 
 def describe_action_outcome(action: str,
                           success: bool,
@@ -229,20 +324,8 @@ def describe_action_outcome(action: str,
                           character_name: str = "") -> str:
     """Describe the outcome of a character's action with cinematic flair."""
     
-    action_lower = action.lower()
-    
     # Determine action category
-    action_category = "general"
-    if any(word in action_lower for word in ["attack", "strike", "hit", "slash", "stab"]):
-        action_category = "attack"
-    elif any(word in action_lower for word in ["cast", "spell", "magic"]):
-        action_category = "spell"
-    elif any(word in action_lower for word in ["sneak", "hide", "stealth"]):
-        action_category = "stealth"
-    elif any(word in action_lower for word in ["jump", "climb", "acrobat"]):
-        action_category = "athletics"
-    elif any(word in action_lower for word in ["persuade", "convince", "talk"]):
-        action_category = "social"
+    action_category = _classify_action(action.lower())
     
     # Generate description based on success and category
     description_parts = []
@@ -276,12 +359,7 @@ def describe_action_outcome(action: str,
     
     else:  # Failure
         if action_category == "attack":
-            failure_descriptions = [
-                "Your weapon passes harmlessly by your target, finding only empty air.",
-                "The timing is off, and your attack fails to connect meaningfully.",
-                "Your opponent's defenses prove superior, turning aside your assault."
-            ]
-            description_parts.append(random.choice(failure_descriptions))
+            description_parts.append(_choice(_ATTACK_FAILURE_DESCRIPTIONS))
         
         elif action_category == "spell":
             description_parts.append("The magical energies resist your will, dissipating without achieving the intended effect.")
@@ -301,84 +379,68 @@ def describe_action_outcome(action: str,
     # Add environmental context if provided
     if environmental_context:
         context_lower = environmental_context.lower()
-        if "difficult terrain" in context_lower or "slippery" in context_lower:
+        context_tokens = set(_WORD_RE.findall(context_lower))
+        if "difficult terrain" in context_lower or not context_tokens.isdisjoint(_FOOTING_WORDS):
             description_parts.append("The challenging footing adds an extra layer of complexity to your action.")
-        elif "windy" in context_lower or "storm" in context_lower:
+        elif not context_tokens.isdisjoint(_WEATHER_WORDS):
             description_parts.append("The harsh weather conditions influence the outcome.")
-        elif "darkness" in context_lower or "dim light" in context_lower:
+        elif "dim light" in context_lower or not context_tokens.isdisjoint(_DARKNESS_WORDS):
             description_parts.append("The poor lighting conditions play a role in how events unfold.")
     
     return " ".join(description_parts)
 
+@functools.lru_cache(maxsize=1024)
+def _classify_action(action_lower: str) -> str:
+    """Map a lowercased action to its narration category."""
+    tokens = set(_WORD_RE.findall(action_lower))
+    for category, words in _ACTION_CATEGORY_WORDS:
+        if not tokens.isdisjoint(words):
+            return category
+    return "general"
+
 def set_scene_atmosphere(current_atmosphere: AtmosphereType,
                         recent_events: List[str],
                         location_type: str = "",
                         target_mood: str = "") -> Dict[str, Any]:
     """Adjust and set the atmospheric tone for the scene."""
     
-    atmosphere_transitions = {
-        AtmosphereType.PEACEFUL: {
-            "escalation": AtmosphereType.TENSE,
-            "mystery": AtmosphereType.MYSTERIOUS,
-            "danger": AtmosphereType.OMINOUS
-        },
-        AtmosphereType.TENSE: {
-            "combat": AtmosphereType.CHAOTIC,
-            "resolution": AtmosphereType.PEACEFUL,
-            "mystery": AtmosphereType.MYSTERIOUS
-        },
-        AtmosphereType.MYSTERIOUS: {
-            "revelation": AtmosphereType.TRIUMPHANT,
-            "danger": AtmosphereType.OMINOUS,
-            "peace": AtmosphereType.PEACEFUL
-        }
-    }
-    
-    # Analyze recent events for atmosphere cues
-    event_text = " ".join(recent_events).lower()
+    # Analyze recent events for atmosphere cues, scanning each event in place
+    triggers = set()
+    for event in recent_events:
+        triggers.update(match.lastgroup for match in _ATMOSPHERE_TRIGGER_RE.finditer(event))
     
     suggested_atmosphere = current_atmosphere
     reasoning = []
     
     # Event-driven atmosphere changes
-    if any(word in event_text for word in ["combat", "attack", "battle", "fight"]):
+    if "combat" in triggers:
         suggested_atmosphere = AtmosphereType.CHAOTIC
         reasoning.append("Recent combat suggests chaotic atmosphere")
     
-    elif any(word in event_text for word in ["discovery", "found", "revealed", "uncovered"]):
-        if "treasure" in event_text or "reward" in event_text:
+    elif "discovery" in triggers:
+        if "reward" in triggers:
             suggested_atmosphere = AtmosphereType.TRIUMPHANT
             reasoning.append("Major discovery suggests triumphant atmosphere")
         else:
             suggested_atmosphere = AtmosphereType.MYSTERIOUS
             reasoning.append("Discovery suggests mysterious atmosphere")
     
-    elif any(word in event_text for word in ["death", "killed", "destroyed", "lost"]):
+    elif "loss" in triggers:
         suggested_atmosphere = AtmosphereType.MELANCHOLY
         reasoning.append("Loss or death suggests melancholy atmosphere")
     
     # Location-based atmosphere influence
     if location_type:
-        location_atmospheres = {
-            "dungeon": AtmosphereType.OMINOUS,
-            "temple": AtmosphereType.SACRED,
-            "tavern": AtmosphereType.COZY,
-            "wilderness": AtmosphereType.PEACEFUL,
-            "ruins": AtmosphereType.MYSTERIOUS,
-            "battlefield": AtmosphereType.CHAOTIC
-        }
-        
-        if location_type.lower() in location_atmospheres:
-            location_suggested = location_atmospheres[location_type.lower()]
+        location_suggested = _LOCATION_ATMOSPHERES.get(location_type.lower())
+        if location_suggested is not None:
             reasoning.append(f"Location type '{location_type}' suggests {location_suggested.value} atmosphere")
     
     # Target mood override
     if target_mood:
-        try:
-            suggested_atmosphere = AtmosphereType(target_mood.lower())
+        target_atmosphere = _ATMOSPHERES_BY_VALUE.get(target_mood.lower())
+        if target_atmosphere is not None:  # Invalid target moods are ignored
+            suggested_atmosphere = target_atmosphere
             reasoning.append(f"Explicitly set to {target_mood}")
-        except ValueError:
-            pass  # Invalid target mood, ignore
     
     return {
         "current_atmosphere": current_atmosphere.value,
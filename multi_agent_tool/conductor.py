@@ -7,14 +7,29 @@ consistent game state.
 """
 
 from google.adk.agents import Agent
-from typing import Dict, List, Any, Optional
-import json
-import uuid
+from typing import Dict, List, Any, Optional, Iterator
+import itertools
+import re
+import secrets
+import sys
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
 from datetime import datetime
 
+from .serialization import dumps
+
+# Number of most recent logged events that determine the session phase
+PHASE_WINDOW = 10
+
 class GameState:
     """Manages the current state of the D&D game session."""
     
+    __slots__ = ("characters", "current_location", "initiative_order", "combat_active",
+                 "turn_number", "world_state",
+                 "_log_ts", "_log_type", "_log_desc", "_log_agent",
+                 "_recent_types", "_recent_type_counts")
+    
     def __init__(self):
         self.characters = {}
         self.current_location = ""
@@ -22,7 +37,14 @@ class GameState:
         self.combat_active = False
         self.turn_number = 0
         self.world_state = {}
-        self.session_log = []
+        # Session log stored column-wise: one list per field instead of one dict per event
+        self._log_ts: List[int] = []
+        self._log_type: List[str] = []
+        self._log_desc: List[str] = []
+        self._log_agent: List[str] = []
+        # Rolling window of recent event types with running counts for session_phase()
+        self._recent_types = deque(maxlen=PHASE_WINDOW)
+        self._recent_type_counts = Counter()
     
     def update_character(self, character_name: str, updates: Dict[str, Any]):
         """Update character information."""
@@ -32,12 +54,53 @@ class GameState:
     
     def log_event(self, event_type: str, description: str, agent: str = "system"):
         """Log an event to the session history."""
-        self.session_log.append({
-            "timestamp": datetime.now().isoformat(),
-            "event_type": event_type,
-            "description": description,
-            "agent": agent
-        })
+        # Store the raw clock reading; ISO formatting is deferred to formatted_log()
+        self._log_ts.append(time.time_ns())
+        # Event types and agent names come from tiny vocabularies; intern to share one copy each
+        self._log_type.append(sys.intern(event_type))
+        self._log_desc.append(description)
+        self._log_agent.append(sys.intern(agent))
+        
+        # Keep the phase counters in step with the window; the oldest type falls out first
+        if len(self._recent_types) == PHASE_WINDOW:
+            self._recent_type_counts[self._recent_types[0]] -= 1
+        self._recent_types.append(event_type)
+        self._recent_type_counts[event_type] += 1
+    
+    @property
+    def session_log(self) -> List[Dict[str, Any]]:
+        """Session log as a list of per-event dicts (materialized on access, same schema as formatted_log)."""
+        return list(self.formatted_log())
+    
+    def formatted_log(self) -> Iterator[Dict[str, Any]]:
+        """Yield session log entries with ISO-8601 timestamps, formatted on demand."""
+        for ts_ns, event_type, description, agent in zip(
+                self._log_ts, self._log_type, self._log_desc, self._log_agent):
+            yield {
+                "timestamp": datetime.fromtimestamp(ts_ns / 1e9).isoformat(),
+                "event_type": event_type,
+                "description": description,
+                "agent": agent
+            }
+    
+    def export_log(self) -> str:
+        """Serialize the formatted session log to a JSON string."""
+        return dumps(list(self.formatted_log()))
+    
+    def session_phase(self) -> str:
+        """Determine the current phase of the session from the recent event window."""
+        combat_events = self._recent_type_counts["combat"]
+        social_events = self._recent_type_counts["social"]
+        discovery_events = self._recent_type_counts["discovery"]
+        
+        if combat_events > 3:
+            return "climax"
+        elif social_events > combat_events:
+            return "character_development"
+        elif discovery_events > 2:
+            return "exploration"
+        else:
+            return "rising_action"
     
     def get_state_summary(self) -> str:
         """Get a summary of the current game state."""
@@ -49,41 +112,75 @@ class GameState:
         ]
         return " | ".join(filter(None, summary_parts))
 
+# Message IDs only need to be unique within a process: random prefix plus a counter
+_MESSAGE_ID_PREFIX = secrets.token_hex(4)
+_message_counter = itertools.count()
+
+@dataclass(slots=True, frozen=True)
+class AgentMessage:
+    """Structured message passed between agents."""
+    message_id: str
+    source_agent: str
+    target_agent: str
+    task_type: str
+    priority: str
+    context: str
+    query: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Nested dict form used at the ADK tool boundary."""
+        return {
+            "message_id": self.message_id,
+            "source_agent": self.source_agent,
+            "target_agent": self.target_agent,
+            "task_type": self.task_type,
+            "priority": self.priority,
+            "payload": {
+                "context": self.context,
+                "query": self.query
+            }
+        }
+
+def build_agent_message(target_agent: str, task_type: str, query: str,
+                        context: str = "", priority: str = "MEDIUM") -> AgentMessage:
+    """Build an AgentMessage from the Conductor with a fresh message ID."""
+    return AgentMessage(
+        f"{_MESSAGE_ID_PREFIX}-{next(_message_counter):x}",
+        "Conductor", target_agent, task_type, priority, context, query
+    )
+
 def create_agent_message(target_agent: str, task_type: str, query: str, 
                         context: str = "", priority: str = "MEDIUM") -> Dict[str, Any]:
     """Create a structured message for inter-agent communication."""
-    return {
-        "message_id": str(uuid.uuid4()),
-        "source_agent": "Conductor",
-        "target_agent": target_agent,
-        "task_type": task_type,
-        "priority": priority,
-        "payload": {
-            "context": context,
-            "query": query
-        }
-    }
+    return build_agent_message(target_agent, task_type, query, context, priority).to_dict()
+
+# Intent categories and patterns
+_INTENT_PATTERNS = {
+    "combat_action": ("attack", "cast spell", "move", "dash", "dodge", "help", "hide", "ready"),
+    "skill_check": ("check for", "search", "investigate", "persuade", "deceive", "insight", 
+                    "perception", "stealth", "athletics", "acrobatics", "pick lock", "disarm trap"),
+    "roleplay": ("say", "tell", "ask", "talk to", "speak with", "conversation"),
+    "movement": ("go to", "walk to", "run to", "travel to", "enter", "exit", "approach"),
+    "inventory": ("use item", "drink potion", "equip", "unequip", "drop", "pick up"),
+    "spell_casting": ("cast", "spell", "cantrip", "ritual"),
+    "information": ("what do i see", "describe", "look around", "examine", "inspect")
+}
+
+# One precompiled alternation per intent, so each category is a single C-level scan.
+# Categories share prefixes ("cast spell" / "cast"), so they are not merged into one regex.
+_INTENT_MATCHERS = tuple(
+    (intent, re.compile("|".join(re.escape(pattern) for pattern in sorted(patterns, key=len, reverse=True))))
+    for intent, patterns in _INTENT_PATTERNS.items()
+)
+
+# Canonical agent order (also the synthesis priority order) used for required_agents
+_AGENT_ORDER = ("Adjudicator", "Chronicler", "Thespian", "Lorekeeper", "Architect")
 
 def parse_player_intent(player_input: str, game_state: GameState) -> Dict[str, Any]:
     """Parse player input to determine intent and required actions."""
     input_lower = player_input.lower().strip()
     
-    # Intent categories and patterns
-    intent_patterns = {
-        "combat_action": ["attack", "cast spell", "move", "dash", "dodge", "help", "hide", "ready"],
-        "skill_check": ["check for", "search", "investigate", "persuade", "deceive", "insight", 
-                       "perception", "stealth", "athletics", "acrobatics", "pick lock", "disarm trap"],
-        "roleplay": ["say", "tell", "ask", "talk to", "speak with", "conversation"],
-        "movement": ["go to", "walk to", "run to", "travel to", "enter", "exit", "approach"],
-        "inventory": ["use item", "drink potion", "equip", "unequip", "drop", "pick up"],
-        "spell_casting": ["cast", "spell", "cantrip", "ritual"],
-        "information": ["what do i see", "describe", "look around", "examine", "inspect"]
-    }
-    
-    detected_intents = []
-    for intent, patterns in intent_patterns.items():
-        if any(pattern in input_lower for pattern in patterns):
-            detected_intents.append(intent)
+    detected_intents = [intent for intent, matcher in _INTENT_MATCHERS if matcher.search(input_lower)]
     
     # Default to roleplay/information if no specific intent detected
     if not detected_intents:
@@ -116,60 +213,63 @@ def parse_player_intent(player_input: str, game_state: GameState) -> Dict[str, A
     
     return {
         "intents": detected_intents,
-        "required_agents": list(required_agents),
+        "required_agents": tuple(agent for agent in _AGENT_ORDER if agent in required_agents),
         "complexity": len(detected_intents),
         "original_input": player_input
     }
 
-def synthesize_agent_responses(agent_responses: Dict[str, str], 
-                              player_intent: Dict[str, Any],
-                              game_state: GameState) -> str:
-    """Synthesize responses from multiple agents into a coherent output."""
-    
-    # Priority order for information synthesis
-    synthesis_order = ["Adjudicator", "Chronicler", "Thespian", "Lorekeeper", "Architect"]
-    
-    output_parts = []
+# Sentence-ending punctuation looked for near the end of a synthesized response
+_SENTENCE_PUNCT_RE = re.compile(r"[?!.]")
+
+def _response_sections(agent_responses: Dict[str, str],
+                       adj_response: Optional[str],
+                       adj_lower: str) -> Iterator[str]:
+    """Yield each agent's contribution in synthesis priority order."""
     
     # Rules and mechanics come first (if applicable)
-    if "Adjudicator" in agent_responses:
-        adj_response = agent_responses["Adjudicator"]
-        if "illegal" in adj_response.lower() or "cannot" in adj_response.lower():
-            # Rules violation - this takes precedence
-            return f"**Rules Check:** {adj_response}"
-        elif any(word in adj_response.lower() for word in ["dc", "roll", "check", "save"]):
-            output_parts.append(f"**Mechanics:** {adj_response}")
+    if adj_response is not None and any(word in adj_lower for word in ("dc", "roll", "check", "save")):
+        yield f"**Mechanics:** {adj_response}"
     
     # Scene description comes next
-    if "Chronicler" in agent_responses:
-        chronicle_response = agent_responses["Chronicler"]
-        if chronicle_response.strip():
-            output_parts.append(chronicle_response)
+    chronicle_response = agent_responses.get("Chronicler")
+    if chronicle_response and chronicle_response.strip():
+        yield chronicle_response
     
     # NPC dialogue and reactions
-    if "Thespian" in agent_responses:
-        npc_response = agent_responses["Thespian"]
-        if npc_response.strip():
-            output_parts.append(npc_response)
+    npc_response = agent_responses.get("Thespian")
+    if npc_response and npc_response.strip():
+        yield npc_response
     
     # Narrative consequences and plot information
-    if "Lorekeeper" in agent_responses:
-        lore_response = agent_responses["Lorekeeper"]
-        if lore_response.strip() and not any(keyword in lore_response.lower() 
-                                           for keyword in ["no immediate", "no significant", "standard"]):
-            output_parts.append(f"**Narrative:** {lore_response}")
+    lore_response = agent_responses.get("Lorekeeper")
+    if lore_response and lore_response.strip() and not any(keyword in lore_response.lower() 
+                                                          for keyword in ("no immediate", "no significant", "standard")):
+        yield f"**Narrative:** {lore_response}"
     
     # Pacing and encounter adjustments (usually subtle)
-    if "Architect" in agent_responses:
-        arch_response = agent_responses["Architect"]
-        if arch_response.strip() and "pacing" in arch_response.lower():
-            output_parts.append(f"*{arch_response}*")
+    arch_response = agent_responses.get("Architect")
+    if arch_response and arch_response.strip() and "pacing" in arch_response.lower():
+        yield f"*{arch_response}*"
+
+def synthesize_agent_responses(agent_responses: Dict[str, str], 
+                              player_intent: Dict[str, Any],
+                              game_state: GameState) -> str:
+    """Synthesize responses from multiple agents into a coherent output."""
+    
+    # A rules violation takes precedence over everything else
+    adj_response = agent_responses.get("Adjudicator")
+    adj_lower = ""
+    if adj_response is not None:
+        adj_lower = adj_response.lower()
+        if "illegal" in adj_lower or "cannot" in adj_lower:
+            return f"**Rules Check:** {adj_response}"
     
     # Join all parts with appropriate spacing
-    final_output = "\n\n".join(output_parts) if output_parts else "I understand your intent, but I need more information to proceed."
+    final_output = ("\n\n".join(_response_sections(agent_responses, adj_response, adj_lower))
+                    or "I understand your intent, but I need more information to proceed.")
     
     # Ensure the response ends with a question or prompt if needed
-    if not any(char in final_output[-20:] for char in "?!."):
+    if not _SENTENCE_PUNCT_RE.search(final_output, max(0, len(final_output) - 20)):
         if "information" in player_intent.get("intents", []):
             final_output += " What would you like to do next?"
         elif "combat_action" in player_intent.get("intents", []):
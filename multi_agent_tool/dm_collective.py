@@ -6,10 +6,21 @@ agents using ADK multi-agent patterns to create a unified DM experience.
 """
 
 from google.adk.agents import Agent, SequentialAgent, ParallelAgent
-from typing import Dict, List, Any, Optional
-import json
+from typing import Dict, List, Any, Optional, Tuple, Union
+import asyncio
+import functools
+import hashlib
+import os
+import random
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
 
+try:
+    from google.api_core import exceptions as api_exceptions
+except ImportError:  # ships with google-adk's Google Cloud stack; without it nothing is retried
+    api_exceptions = None
+
 # Import all specialist agents
 from .conductor import conductor_agent, GameState, parse_player_intent, synthesize_agent_responses
 from .lorekeeper import lorekeeper_agent, WorldBible
@@ -18,17 +29,79 @@ from .thespian import thespian_agent, NPCPersona, NPCDisposition
 from .adjudicator import adjudicator_agent
 from .architect import architect_agent, PartyComposition, EncounterType
 
+# Maximum number of turns kept in a session's in-memory log
+SESSION_LOG_LIMIT = 4096
+
+# Number of most recent turns handed to specialists as context
+RECENT_TURNS = 5
+
+# Specialist call shaping: concurrent calls in flight and calls started per minute
+DEFAULT_MAX_CONCURRENCY = int(os.environ.get("DM_MAX_CONC", 4))
+DEFAULT_RATE_LIMIT = 60
+
+# Maximum number of specialist responses memoized per session
+RESPONSE_CACHE_SIZE = 1024
+
+# Transient API failures are retried with exponential backoff and jitter
+MAX_AGENT_ATTEMPTS = 3
+_TRANSIENT_ERRORS = (
+    (api_exceptions.ResourceExhausted, api_exceptions.DeadlineExceeded, api_exceptions.ServiceUnavailable)
+    if api_exceptions is not None else ()
+)
+
+# Seconds a specialist is skipped after a transient failure outlasts every retry
+BREAKER_COOLDOWN = 30.0
+
+class _TokenBucket:
+    """Async token bucket that paces calls to ``rate`` per ``per`` seconds."""
+    
+    __slots__ = ("_rate", "_per", "_tokens", "_updated")
+    
+    def __init__(self, rate: float, per: float = 60.0):
+        self._rate = rate
+        self._per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+    
+    async def acquire(self):
+        """Wait until a token is available, then take it."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self._rate, self._tokens + (now - self._updated) * self._rate / self._per)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) * self._per / self._rate)
+
 class DMCollectiveSession:
     """Manages a complete D&D session with the AI-DM Collective."""
     
-    def __init__(self):
+    __slots__ = ("game_state", "world_bible", "session_log", "recent_turns", "active_npcs", "current_atmosphere",
+                 "party_composition", "conductor", "lorekeeper", "chronicler", "thespian",
+                 "adjudicator", "architect", "task_analyzer", "response_synthesizer",
+                 "coordination_workflow", "_agent_semaphore", "_rate_limiter",
+                 "_response_cache", "_breaker_open_until")
+    
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 rate_limit: float = DEFAULT_RATE_LIMIT):
         self.game_state = GameState()
         self.world_bible = WorldBible()
-        self.session_log = []
+        self.session_log = deque(maxlen=SESSION_LOG_LIMIT)
+        # Kept alongside session_log so recent context never walks the full log
+        self.recent_turns = deque(maxlen=RECENT_TURNS)
         self.active_npcs = {}
         self.current_atmosphere = AtmosphereType.PEACEFUL
         self.party_composition = None
         
+        # Shared across all specialist calls so bursts stay under API quotas
+        self._agent_semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = _TokenBucket(rate_limit)
+        # LRU memo of specialist responses for recurring inputs ("I look around", "I attack")
+        self._response_cache: "OrderedDict[Tuple[str, bytes, Tuple], str]" = OrderedDict()
+        # Per-specialist circuit breaker: monotonic time until which the agent is skipped
+        self._breaker_open_until: Dict[str, float] = {}
+        
         # Initialize agents
         self.conductor = conductor_agent
         self.lorekeeper = lorekeeper_agent
@@ -122,22 +195,10 @@ class DMCollectiveSession:
             tools=[]
         )
 
-def create_agent_consultation_prompt(agent_name: str, player_input: str, 
-                                   game_context: Dict[str, Any]) -> str:
-    """Create a focused prompt for consulting a specialist agent."""
-    
-    base_context = f"""
-    Current Game Context:
-    - Location: {game_context.get('current_location', 'Unknown')}
-    - Active NPCs: {', '.join(game_context.get('active_npcs', []))}
-    - Combat Active: {game_context.get('combat_active', False)}
-    - Session Phase: {game_context.get('session_phase', 'exploration')}
-    
-    Player Input: "{player_input}"
-    """
-    
-    agent_specific_prompts = {
-        "lorekeeper": f"""{base_context}
+# Static agent-specific instruction blocks. They lead the prompt so that every
+# consultation of an agent shares a byte-identical prefix (prompt-cache friendly).
+_AGENT_PROMPT_BLOCKS = {
+    "lorekeeper": """
         
         As the Lorekeeper, analyze this player action for:
         1. Narrative consequences and world impact
@@ -147,8 +208,8 @@ def create_agent_consultation_prompt(agent_name: str, player_input: str,
         
         Focus on how this action affects the larger story and world state.
         """,
-        
-        "chronicler": f"""{base_context}
+    
+    "chronicler": """
         
         As the Chronicler, provide:
         1. Vivid scene description for the current situation
@@ -158,8 +219,8 @@ def create_agent_consultation_prompt(agent_name: str, player_input: str,
         
         Paint the scene with words and engage the players' senses.
         """,
-        
-        "thespian": f"""{base_context}
+    
+    "thespian": """
         
         As the Thespian, handle:
         1. NPC reactions and dialogue
@@ -169,8 +230,8 @@ def create_agent_consultation_prompt(agent_name: str, player_input: str,
         
         Give voice and life to the non-player characters in this scene.
         """,
-        
-        "adjudicator": f"""{base_context}
+    
+    "adjudicator": """
         
         As the Adjudicator, determine:
         1. Rules legality of the proposed action
@@ -180,8 +241,8 @@ def create_agent_consultation_prompt(agent_name: str, player_input: str,
         
         Provide authoritative, consistent rule enforcement.
         """,
-        
-        "architect": f"""{base_context}
+    
+    "architect": """
         
         As the Architect, assess:
         1. Pacing implications of this action
@@ -191,9 +252,115 @@ def create_agent_consultation_prompt(agent_name: str, player_input: str,
         
         Ensure the game flow remains engaging and appropriately challenging.
         """
-    }
+}
+
+@functools.lru_cache(maxsize=64)
+def _format_game_context(current_location: str, active_npcs: Tuple[str, ...],
+                         combat_active: bool, session_phase: str) -> str:
+    """Format the game context block; it changes far less often than player input."""
+    return f"""
+    Current Game Context:
+    - Location: {current_location}
+    - Active NPCs: {', '.join(active_npcs)}
+    - Combat Active: {combat_active}
+    - Session Phase: {session_phase}
     
-    return agent_specific_prompts.get(agent_name, base_context)
+"""
+
+def create_agent_consultation_prompt(agent_name: str, player_input: str, 
+                                   game_context: Dict[str, Any]) -> str:
+    """Create a focused prompt for consulting a specialist agent."""
+    
+    context_block = _format_game_context(
+        game_context.get('current_location', 'Unknown'),
+        tuple(game_context.get('active_npcs', ())),
+        game_context.get('combat_active', False),
+        game_context.get('session_phase', 'exploration')
+    )
+    
+    player_block = f"""    Player Input: "{player_input}"
+    """
+    
+    # Static instructions first, volatile game context and player input last
+    return _AGENT_PROMPT_BLOCKS.get(agent_name, "") + context_block + player_block
+
+# Specialists consulted concurrently once the Adjudicator's rules gate has run
+_CONCURRENT_AGENTS = ("Lorekeeper", "Architect", "Chronicler", "Thespian")
+
+# Intents that give the Architect something to pace or design around
+_ARCHITECT_INTENTS = frozenset({"combat_action", "movement"})
+
+def _has_contribution(dm_session: DMCollectiveSession, agent_name: str,
+                      intents: List[str], input_lower: str) -> bool:
+    """Cheap pre-filter: False when a specialist would have nothing to add this turn."""
+    if agent_name == "Thespian":
+        # Someone to voice: the player is addressing a character, or NPCs are on scene
+        return "roleplay" in intents or bool(dm_session.active_npcs)
+    if agent_name == "Lorekeeper":
+        # Needs a known faction or quest reference, or a consequential action verb
+        return bool(dm_session.world_bible.match_keywords(input_lower))
+    if agent_name == "Architect":
+        return dm_session.game_state.combat_active or not _ARCHITECT_INTENTS.isdisjoint(intents)
+    return True
+
+def _response_cache_key(agent_name: str, player_input: str,
+                        game_context: Dict[str, Any]) -> Tuple[str, bytes, Tuple]:
+    """Cache key for a specialist response: agent, normalized input and stable context."""
+    input_digest = hashlib.blake2b(player_input.lower().strip().encode(), digest_size=16).digest()
+    # Only the slowly changing context; timestamps and recent events would defeat reuse
+    stable_context = (
+        game_context.get("current_location"),
+        game_context.get("combat_active"),
+        game_context.get("session_phase")
+    )
+    return agent_name, input_digest, stable_context
+
+async def _call_agent(dm_session: DMCollectiveSession, agent_name: str, prompt: str,
+                      player_input: str) -> str:
+    """Make one paced specialist call."""
+    async with dm_session._agent_semaphore:
+        await dm_session._rate_limiter.acquire()
+        # In real implementation, this would be: return await getattr(dm_session, agent_name.lower()).process(prompt)
+        # For now, we'll simulate the response structure
+        if agent_name == "Adjudicator":
+            return f"Rules assessment for: {player_input}"
+        return f"{agent_name} response for: {player_input}"
+
+async def _consult_agent(dm_session: DMCollectiveSession, agent_name: str,
+                         player_input: str, game_context: Dict[str, Any],
+                         cache_hits: Optional[List[str]] = None) -> str:
+    """Consult a single specialist agent and return its response."""
+    cache = dm_session._response_cache
+    cache_key = _response_cache_key(agent_name, player_input, game_context)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        cache.move_to_end(cache_key)
+        if cache_hits is not None:
+            cache_hits.append(agent_name)
+        return cached
+    
+    # An open breaker degrades to an empty contribution, which synthesis skips
+    if time.monotonic() < dm_session._breaker_open_until.get(agent_name, 0.0):
+        return ""
+    
+    prompt = create_agent_consultation_prompt(agent_name.lower(), player_input, game_context)
+    for attempt in range(MAX_AGENT_ATTEMPTS):
+        try:
+            response = await _call_agent(dm_session, agent_name, prompt, player_input)
+            break
+        except _TRANSIENT_ERRORS:
+            if attempt + 1 < MAX_AGENT_ATTEMPTS:
+                await asyncio.sleep(2 ** attempt + random.random())
+                continue
+            # Sustained outage, throttling or timeouts: stop calling this specialist
+            # for a while and let the others' answers carry the turn
+            dm_session._breaker_open_until[agent_name] = time.monotonic() + BREAKER_COOLDOWN
+            return ""
+    
+    cache[cache_key] = response
+    if len(cache) > RESPONSE_CACHE_SIZE:
+        cache.popitem(last=False)
+    return response
 
 async def process_player_input(dm_session: DMCollectiveSession, 
                              player_input: str,
@@ -202,29 +369,21 @@ async def process_player_input(dm_session: DMCollectiveSession,
     
     if player_context is None:
         player_context = {}
+    intent_analysis = None
     
     # Update game context
     game_context = {
         "current_location": dm_session.game_state.current_location,
         "active_npcs": list(dm_session.active_npcs.keys()),
         "combat_active": dm_session.game_state.combat_active,
-        "session_phase": _determine_session_phase(dm_session.session_log),
+        "session_phase": dm_session.game_state.session_phase() if dm_session.session_log else "setup",
         "party_composition": dm_session.party_composition,
         "current_atmosphere": dm_session.current_atmosphere.value,
-        "recent_events": dm_session.session_log[-5:] if dm_session.session_log else []
+        "recent_events": list(dm_session.recent_turns)
     }
     
     try:
         # Step 1: Analyze what agents are needed
-        task_analysis_prompt = f"""
-        Analyze this player input and game context to determine coordination strategy:
-        
-        Player Input: "{player_input}"
-        Game Context: {json.dumps(game_context, indent=2)}
-        
-        Determine which specialist agents should be consulted and in what order.
-        """
-        
         # For simplicity, we'll implement direct coordination logic here
         # In a full ADK implementation, this would use the coordination workflow
         
@@ -234,29 +393,27 @@ async def process_player_input(dm_session: DMCollectiveSession,
         
         # Step 2: Consult specialist agents
         agent_responses = {}
+        cache_hits = []
         
         # Adjudicator goes first if needed (rules are paramount)
         if "Adjudicator" in required_agents:
-            adj_prompt = create_agent_consultation_prompt("adjudicator", player_input, game_context)
-            # In real implementation, this would be: agent_responses["Adjudicator"] = await dm_session.adjudicator.process(adj_prompt)
-            # For now, we'll simulate the response structure
-            agent_responses["Adjudicator"] = f"Rules assessment for: {player_input}"
-        
-        # Run other agents in parallel groups
-        parallel_group_1 = ["Lorekeeper", "Architect"] 
-        parallel_group_2 = ["Chronicler", "Thespian"]
-        
-        for agent_name in parallel_group_1:
-            if agent_name in required_agents:
-                prompt = create_agent_consultation_prompt(agent_name.lower(), player_input, game_context)
-                # Simulate agent response
-                agent_responses[agent_name] = f"{agent_name} response for: {player_input}"
-        
-        for agent_name in parallel_group_2:
-            if agent_name in required_agents:
-                prompt = create_agent_consultation_prompt(agent_name.lower(), player_input, game_context)
-                # Simulate agent response  
-                agent_responses[agent_name] = f"{agent_name} response for: {player_input}"
+            agent_responses["Adjudicator"] = await _consult_agent(
+                dm_session, "Adjudicator", player_input, game_context, cache_hits
+            )
+        
+        # Every other specialist is independent, so consult them concurrently in one wave
+        # Specialists with nothing to contribute are skipped outright
+        input_lower = player_input.lower()
+        concurrent_agents = [
+            name for name in _CONCURRENT_AGENTS
+            if name in required_agents
+            and _has_contribution(dm_session, name, intent_analysis["intents"], input_lower)
+        ]
+        responses = await asyncio.gather(*(
+            _consult_agent(dm_session, name, player_input, game_context, cache_hits)
+            for name in concurrent_agents
+        ))
+        agent_responses.update(zip(concurrent_agents, responses))
         
         # Step 3: Synthesize responses
         final_response = synthesize_agent_responses(
@@ -272,54 +429,39 @@ async def process_player_input(dm_session: DMCollectiveSession,
             agent="player"
         )
         
-        dm_session.session_log.append({
+        turn_entry = {
             "timestamp": datetime.now().isoformat(),
             "player_input": player_input,
             "agent_responses": agent_responses,
             "final_response": final_response,
-            "intent_analysis": intent_analysis
-        })
+            "intent_analysis": intent_analysis,
+            "cache_hits": cache_hits,
+            "cache_misses": len(agent_responses) - len(cache_hits)
+        }
+        dm_session.session_log.append(turn_entry)
+        dm_session.recent_turns.append(turn_entry)
         
         return final_response
         
     except Exception as e:
-        # Fallback response
+        # Transient API failures are absorbed per specialist, so anything reaching here
+        # is a bug: record it with the parsed intent and let it surface
         dm_session.game_state.log_event(
             event_type="error",
-            description=f"Error processing input: {str(e)}",
+            description=f"Unexpected error processing input: {e!r} (intent: {intent_analysis})",
             agent="system"
         )
-        return f"I understand your intent, but I need a moment to process that. Could you rephrase or provide more details?"
-
-def _determine_session_phase(session_log: List[Dict]) -> str:
-    """Determine the current phase of the session based on recent events."""
-    
-    if not session_log:
-        return "setup"
-    
-    recent_events = session_log[-10:]  # Look at last 10 events
-    event_types = [event.get("event_type", "") for event in recent_events]
-    
-    combat_events = event_types.count("combat")
-    social_events = event_types.count("social") 
-    discovery_events = event_types.count("discovery")
-    
-    if combat_events > 3:
-        return "climax"
-    elif social_events > combat_events:
-        return "character_development"
-    elif discovery_events > 2:
-        return "exploration"
-    else:
-        return "rising_action"
+        raise
 
 def initialize_dm_session(campaign_name: str = "New Campaign",
-                         party_info: Optional[Dict[str, Any]] = None) -> DMCollectiveSession:
+                         party_info: Optional[Union[PartyComposition, Dict[str, Any]]] = None) -> DMCollectiveSession:
     """Initialize a new DM session with the AI-DM Collective."""
     
     session = DMCollectiveSession()
     
-    if party_info:
+    if isinstance(party_info, PartyComposition):
+        session.party_composition = party_info
+    elif party_info:
         session.party_composition = PartyComposition(
             size=party_info.get("size", 4),
             average_level=party_info.get("average_level", 3),
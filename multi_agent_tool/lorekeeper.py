@@ -6,11 +6,35 @@ managing plot progression, lore, and the long-term consequences of player action
 """
 
 from google.adk.agents import Agent
-from typing import Dict, List, Any, Optional
-import json
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Set, Tuple
+import functools
+import re
+from collections import defaultdict, deque
+from dataclasses import dataclass, fields
 from enum import Enum
 
+from .serialization import dumps, loads
+
+# Maximum number of world events retained in memory; older events are dropped
+WORLD_EVENT_LIMIT = 10_000
+
+# Action verbs that shape narrative consequences, tagged for the keyword matcher
+_ACTION_VERB_TAGS = {
+    "negative": ("attack", "oppose", "destroy", "steal from"),
+    "positive": ("help", "aid", "support", "ally with"),
+    "major": ("destroy", "kill", "reveal", "expose", "betray", "steal", "burn", "demolish"),
+    "investigate": ("search", "investigate", "examine")
+}
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls) -> Tuple[str, ...]:
+    """Field names of a dataclass, resolved once per class."""
+    return tuple(field.name for field in fields(cls))
+
+def _shallow_asdict(obj) -> Dict[str, Any]:
+    """Field dict of a dataclass instance; unlike asdict, lists are shared rather than deep-copied."""
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
+
 class QuestStatus(Enum):
     INACTIVE = "inactive"
     ACTIVE = "active" 
@@ -33,7 +57,7 @@ class Quest:
     consequences: Dict[str, str] = None
     
     def to_dict(self):
-        return asdict(self)
+        return _shallow_asdict(self)
 
 @dataclass
 class WorldFaction:
@@ -48,7 +72,7 @@ class WorldFaction:
     power_level: int  # 1-10
     
     def to_dict(self):
-        return asdict(self)
+        return _shallow_asdict(self)
 
 @dataclass
 class WorldLocation:
@@ -63,10 +87,14 @@ class WorldLocation:
     visited_by_party: bool = False
     
     def to_dict(self):
-        return asdict(self)
+        return _shallow_asdict(self)
 
 class WorldBible:
-    """Comprehensive storage for campaign world information."""
+    """Comprehensive storage for campaign world information.
+    
+    Quest and faction keywords feed cached lookup tables; after editing one in
+    place, add it again (or call reindex) so those caches see the change.
+    """
     
     def __init__(self):
         self.quests: Dict[str, Quest] = {}
@@ -75,18 +103,25 @@ class WorldBible:
         self.major_npcs: Dict[str, Dict] = {}
         self.world_history: List[Dict] = []
         self.player_backstories: Dict[str, Dict] = {}
-        self.world_events: List[Dict] = []
+        self.world_events: deque = deque(maxlen=WORLD_EVENT_LIMIT)
         self.cosmology: Dict[str, Any] = {}
-        
+        # Keyword matcher for analyze_narrative_consequences, rebuilt lazily after mutation
+        self._keyword_matcher = None
+        # IDs of active quests in insertion order, rebuilt lazily after quest mutations
+        self._active_quest_ids: Optional[Tuple[str, ...]] = None
+    
     def add_quest(self, quest: Quest):
         """Add a quest to the world bible."""
         self.quests[quest.id] = quest
+        self._keyword_matcher = None
+        self._active_quest_ids = None
     
     def update_quest_status(self, quest_id: str, new_status: QuestStatus, notes: str = ""):
         """Update the status of a quest."""
         if quest_id in self.quests:
             old_status = self.quests[quest_id].status
             self.quests[quest_id].status = new_status
+            self._active_quest_ids = None
             self.world_events.append({
                 "type": "quest_update",
                 "quest_id": quest_id,
@@ -98,6 +133,7 @@ class WorldBible:
     def add_faction(self, faction: WorldFaction):
         """Add a faction to the world bible."""
         self.factions[faction.name] = faction
+        self._keyword_matcher = None
     
     def modify_faction_reputation(self, faction_name: str, change: int, reason: str = ""):
         """Modify a faction's reputation with the party."""
@@ -113,6 +149,54 @@ class WorldBible:
                 "reason": reason
             })
     
+    def _keyword_fingerprint(self) -> Tuple:
+        """Cheap summary of the keyword lists, so appends to goals or objectives rebuild the matcher."""
+        return (
+            tuple((name, len(faction.goals)) for name, faction in self.factions.items()),
+            tuple((quest_id, len(quest.objectives), len(quest.related_npcs), len(quest.locations))
+                  for quest_id, quest in self.quests.items()),
+        )
+    
+    def _build_keyword_matcher(self):
+        """Compile every faction, quest and verb keyword into one overlapping-match regex."""
+        tags_by_keyword: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+        for verb_kind, verbs in _ACTION_VERB_TAGS.items():
+            for verb in verbs:
+                tags_by_keyword[verb].add(("verb", verb_kind))
+        for faction_name, faction in self.factions.items():
+            for keyword in [faction.name] + faction.goals:
+                tags_by_keyword[keyword.lower()].add(("faction", faction_name))
+        for quest_id, quest in self.quests.items():
+            for keyword in quest.objectives + quest.related_npcs + quest.locations:
+                tags_by_keyword[keyword.lower()].add(("quest", quest_id))
+        
+        # An empty keyword is a substring of everything
+        always = frozenset(tags_by_keyword.pop("", ()))
+        keywords = sorted(tags_by_keyword, key=len, reverse=True)
+        # The lookahead reports the longest keyword at each position; keywords it
+        # contains are also present there, so each match carries their tags too
+        closure = {
+            keyword: frozenset().union(*(tags_by_keyword[other] for other in keywords if other in keyword))
+            for keyword in keywords
+        }
+        pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+        return self._keyword_fingerprint(), pattern, closure, always
+    
+    def match_keywords(self, text_lower: str) -> Set[Tuple[str, str]]:
+        """Tags of every faction, quest and verb keyword occurring in lowercased text.
+        
+        Keyword lists that grow or shrink are noticed automatically; a keyword
+        replaced in place needs its faction or quest re-added (or reindex).
+        """
+        if self._keyword_matcher is None or self._keyword_matcher[0] != self._keyword_fingerprint():
+            self._keyword_matcher = self._build_keyword_matcher()
+        _, pattern, closure, always = self._keyword_matcher
+        
+        hits = set(always)
+        for match in pattern.finditer(text_lower):
+            hits |= closure[match.group(1)]
+        return hits
+    
     def add_location(self, location: WorldLocation):
         """Add a location to the world bible."""
         self.locations[location.name] = location
@@ -124,12 +208,59 @@ class WorldBible:
     
     def get_active_quests(self) -> List[Quest]:
         """Get all active quests."""
-        return [quest for quest in self.quests.values() if quest.status == QuestStatus.ACTIVE]
+        return [self.quests[quest_id] for quest_id in self.active_quest_ids()]
+    
+    def active_quest_ids(self) -> Tuple[str, ...]:
+        """IDs of all active quests, cached until a quest is added or changes status.
+        
+        Status changes must go through update_quest_status (or be followed by
+        reindex); assigning quest.status directly is not seen by the cache.
+        """
+        if self._active_quest_ids is None:
+            self._active_quest_ids = tuple(quest_id for quest_id, quest in self.quests.items()
+                                           if quest.status == QuestStatus.ACTIVE)
+        return self._active_quest_ids
     
     def get_location_info(self, location_name: str) -> Optional[WorldLocation]:
         """Get information about a specific location."""
         return self.locations.get(location_name)
     
+    def to_json(self) -> str:
+        """Serialize the world bible to a JSON string for persistence."""
+        return dumps({
+            "quests": [quest.to_dict() for quest in self.quests.values()],
+            "factions": [faction.to_dict() for faction in self.factions.values()],
+            "locations": [location.to_dict() for location in self.locations.values()],
+            "major_npcs": self.major_npcs,
+            "world_history": self.world_history,
+            "player_backstories": self.player_backstories,
+            "world_events": list(self.world_events),
+            "cosmology": self.cosmology
+        })
+    
+    @classmethod
+    def from_json(cls, data) -> "WorldBible":
+        """Restore a world bible saved with to_json."""
+        state = loads(data)
+        world_bible = cls()
+        for quest in state.get("quests", []):
+            world_bible.add_quest(Quest(**{**quest, "status": QuestStatus(quest["status"])}))
+        for faction in state.get("factions", []):
+            world_bible.add_faction(WorldFaction(**faction))
+        for location in state.get("locations", []):
+            world_bible.add_location(WorldLocation(**location))
+        world_bible.major_npcs = state.get("major_npcs", {})
+        world_bible.world_history = state.get("world_history", [])
+        world_bible.player_backstories = state.get("player_backstories", {})
+        world_bible.world_events.extend(state.get("world_events", []))
+        world_bible.cosmology = state.get("cosmology", {})
+        return world_bible
+    
+    def reindex(self):
+        """Drop the cached keyword matcher and active quest list after in-place edits."""
+        self._keyword_matcher = None
+        self._active_quest_ids = None
+    
     def search_lore(self, query: str) -> Dict[str, List[str]]:
         """Search for lore related to a query."""
         query_lower = query.lower()
@@ -176,19 +307,20 @@ def analyze_narrative_consequences(action_description: str, world_bible: WorldBi
         "severity": "minor"  # minor, moderate, major, critical
     }
     
+    # One scan of the action text finds every faction, quest and verb keyword
+    hits = world_bible.match_keywords(action_lower)
+    
     # Analyze for faction impacts
-    for faction_name, faction in world_bible.factions.items():
-        faction_keywords = [faction.name.lower()] + [goal.lower() for goal in faction.goals]
-        
-        if any(keyword in action_lower for keyword in faction_keywords):
-            if any(negative in action_lower for negative in ["attack", "oppose", "destroy", "steal from"]):
+    for faction_name in world_bible.factions:
+        if ("faction", faction_name) in hits:
+            if ("verb", "negative") in hits:
                 consequences["faction_impacts"].append({
                     "faction": faction_name,
                     "impact": "negative",
                     "reputation_change": -10,
                     "description": f"Action may anger the {faction_name}"
                 })
-            elif any(positive in action_lower for positive in ["help", "aid", "support", "ally with"]):
+            elif ("verb", "positive") in hits:
                 consequences["faction_impacts"].append({
                     "faction": faction_name, 
                     "impact": "positive",
@@ -197,24 +329,16 @@ def analyze_narrative_consequences(action_description: str, world_bible: WorldBi
                 })
     
     # Analyze for quest progression
-    for quest_id, quest in world_bible.quests.items():
-        if quest.status != QuestStatus.ACTIVE:
-            continue
-            
-        quest_keywords = quest.objectives + quest.related_npcs + quest.locations
-        if any(keyword.lower() in action_lower for keyword in quest_keywords):
+    for quest_id in world_bible.active_quest_ids():
+        if ("quest", quest_id) in hits:
             consequences["quest_updates"].append({
                 "quest_id": quest_id,
-                "quest_title": quest.title,
+                "quest_title": world_bible.quests[quest_id].title,
                 "potential_progress": "Action may advance this quest objective"
             })
     
     # Check for major world-altering actions
-    major_actions = [
-        "destroy", "kill", "reveal", "expose", "betray", "steal", "burn", "demolish"
-    ]
-    
-    if any(action in action_lower for action in major_actions):
+    if ("verb", "major") in hits:
         consequences["severity"] = "major"
         consequences["world_changes"].append("This action may have lasting consequences")
     
@@ -227,7 +351,7 @@ def analyze_narrative_consequences(action_description: str, world_bible: WorldBi
     # Check for location-specific consequences
     if current_location and current_location in world_bible.locations:
         location = world_bible.locations[current_location]
-        if location.secrets and any(investigate in action_lower for investigate in ["search", "investigate", "examine"]):
+        if location.secrets and ("verb", "investigate") in hits:
             consequences["immediate_effects"].append(
                 f"This action might uncover secrets about {current_location}"
             )
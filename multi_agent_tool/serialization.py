@@ -0,0 +1,36 @@
+"""
+Serialization helpers for agent messages and session exports.
+
+orjson is used when it is installed; otherwise the standard library json
+module is used. Both paths produce the same JSON text for the plain dicts,
+lists, tuples and strings exchanged between agents.
+"""
+
+import json
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+def _default(obj: Any) -> Any:
+    """Encode the few non-JSON types that appear in agent payloads."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps(obj: Any) -> str:
+    """Serialize ``obj`` to a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default).decode("utf-8")
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":"))
+
+def loads(data: Any) -> Any:
+    """Deserialize a JSON string or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
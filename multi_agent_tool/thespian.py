@@ -6,10 +6,13 @@ managing their dialogue, personality, and in-the-moment decision-making.
 """
 
 from google.adk.agents import Agent
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, FrozenSet, List, Any, NamedTuple, Optional, Tuple
+import functools
 import random
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 
 class NPCDisposition(Enum):
     HOSTILE = "hostile"
@@ -30,7 +33,7 @@ class NPCType(Enum):
     MONSTER = "monster"
     MAGICAL_BEING = "magical_being"
 
-@dataclass
+@dataclass(slots=True)
 class NPCPersona:
     """Represents an NPC's personality and characteristics."""
     name: str
@@ -45,6 +48,188 @@ class NPCPersona:
     disposition: NPCDisposition
     secrets: List[str]
     goals: List[str]
+    # Set view of personality_traits for membership checks, derived in __post_init__
+    personality_traits_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    # Lowercased occupation used for table lookups, derived in __post_init__
+    _occupation_key: str = field(init=False, repr=False, compare=False)
+    # Speech transformer compiled from speech_patterns on first use (see _speech_transformer)
+    _speech_transformer: Optional[Callable[[str], str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.personality_traits_set = frozenset(self.personality_traits)
+        self._occupation_key = self.occupation.lower()
+
+class OccupationTemplate(NamedTuple):
+    """Everything a persona draws from its occupation."""
+    traits: Tuple[str, ...]
+    motivations: Tuple[str, ...]
+    vocabulary_level: str
+    knowledge_areas: Tuple[str, ...]
+
+# Canonical persona templates by occupation
+_OCCUPATIONS = MappingProxyType({
+    "merchant": OccupationTemplate(
+        ("shrewd", "persuasive", "materialistic", "calculating"),
+        ("earn profit", "expand business", "maintain reputation"),
+        "business terminology, persuasive",
+        ("trade routes", "market prices", "business practices", "local economy")
+    ),
+    "guard": OccupationTemplate(
+        ("dutiful", "suspicious", "protective", "authoritative"),
+        ("protect the innocent", "uphold the law", "earn promotion"),
+        "direct, authoritative",
+        ("local laws", "security procedures", "criminal activity", "city layout")
+    ),
+    "scholar": OccupationTemplate(
+        ("curious", "analytical", "verbose", "absent-minded"),
+        ("discover truth", "preserve knowledge", "teach others"),
+        "highly educated, uses complex terms",
+        ("history", "arcane knowledge", "research methods", "ancient texts")
+    ),
+    "criminal": OccupationTemplate(
+        ("cunning", "secretive", "opportunistic", "street-smart"),
+        ("acquire wealth", "avoid capture", "gain power"),
+        "street slang, informal",
+        ("underworld contacts", "illegal activities", "city secrets", "escape routes")
+    ),
+    "noble": OccupationTemplate(
+        ("proud", "refined", "entitled", "diplomatic"),
+        ("maintain status", "protect family honor", "gain influence"),
+        "refined, formal language",
+        ("politics", "court intrigue", "family lineages", "social customs")
+    ),
+    "commoner": OccupationTemplate(
+        ("practical", "humble", "hardworking", "simple"),
+        ("support family", "survive hardships", "find happiness"),
+        "simple, practical language",
+        ("local gossip", "daily life", "survival skills", "folk wisdom")
+    ),
+    "religious": OccupationTemplate(
+        ("devout", "compassionate", "wise", "ceremonial"),
+        ("serve deity", "help the faithful", "spread teachings"),
+        "ceremonial, spiritual terminology",
+        ("theology", "rituals", "healing", "moral guidance")
+    )
+})
+
+# Template for occupations without a specific entry
+_DEFAULT_OCCUPATION = OccupationTemplate(
+    (), ("survive", "find purpose", "help others"), "standard vocabulary", ("general local knowledge",)
+)
+
+# Traits any NPC may have, used to pad out a persona
+_UNIVERSAL_TRAITS = (
+    "optimistic", "pessimistic", "cautious", "brave", "generous", "selfish",
+    "honest", "deceptive", "patient", "impatient", "loyal", "independent",
+    "social", "reclusive", "ambitious", "content", "serious", "humorous"
+)
+
+_FEAR_OPTIONS = (
+    "death", "poverty", "abandonment", "failure", "exposure of secrets",
+    "loss of status", "physical harm", "supernatural threats", "betrayal",
+    "change", "authority", "the unknown", "public speaking", "magic"
+)
+
+# Accent/dialect based on race
+_RACE_ACCENTS = MappingProxyType({
+    "dwarf": {"accent": "Scottish-inspired", "quirks": "Uses 'aye' frequently, calls people 'lad/lass'"},
+    "elf": {"accent": "Melodic, formal", "quirks": "Speaks precisely, uses archaic terms"},
+    "halfling": {"accent": "Rural, friendly", "quirks": "Mentions food often, uses diminutives"},
+    "human": {"accent": "Varies by region", "quirks": "Depends on background"},
+    "tiefling": {"accent": "Smooth, sometimes sinister", "quirks": "May use infernal expressions"},
+    "dragonborn": {"accent": "Formal, draconic influence", "quirks": "References honor frequently"}
+})
+
+# Tone based on disposition
+_DISPOSITION_TONES = MappingProxyType({
+    NPCDisposition.HOSTILE: "aggressive, confrontational",
+    NPCDisposition.UNFRIENDLY: "cold, dismissive", 
+    NPCDisposition.NEUTRAL: "polite but distant",
+    NPCDisposition.FRIENDLY: "warm, welcoming",
+    NPCDisposition.HELPFUL: "eager to assist, encouraging"
+})
+
+# Decision score modifiers from disposition toward players and from relationship
+_DISPOSITION_MODIFIERS = MappingProxyType({
+    NPCDisposition.HOSTILE: -30,
+    NPCDisposition.UNFRIENDLY: -10,
+    NPCDisposition.NEUTRAL: 0,
+    NPCDisposition.FRIENDLY: 10,
+    NPCDisposition.HELPFUL: 20
+})
+_RELATIONSHIP_MODIFIERS = MappingProxyType({
+    "enemy": -50,
+    "rival": -20,
+    "stranger": 0,
+    "acquaintance": 10,
+    "friend": 25,
+    "ally": 40
+})
+
+# Decision score adjustments: trait or occupation -> (option keywords, score change)
+_TRAIT_OPTION_SCORES = MappingProxyType({
+    "helpful": (("help", "assist"), 20),
+    "selfish": (("help", "sacrifice"), -15),
+    "brave": (("fight", "stand"), 15),
+    "cautious": (("risk", "dangerous"), -20),
+    "greedy": (("gold", "reward"), 25),
+    "honest": (("lie", "deceive"), -30),
+    "loyal": (("betray", "abandon"), -40)
+})
+_OCCUPATION_OPTION_SCORES = MappingProxyType({
+    "merchant": (("profit", "business"), 20),
+    "guard": (("law", "protect"), 15),
+    "criminal": (("illegal", "steal"), 10)
+})
+
+# Tokenizer for player input; contractions split at the apostrophe ("what's" -> "what", "s")
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Conversation types in priority order: (type, single-word keywords, multi-word phrases).
+# Keywords are whole tokens, so every verb lists its -s, past and -ing forms and every
+# noun its plural (the policy shared with the chronicler and adjudicator word tables).
+_CONVERSATION_KEYWORDS = (
+    ("commerce", frozenset({
+        "buy", "buys", "bought", "buying", "buyer", "buyers",
+        "sell", "sells", "sold", "selling", "seller", "sellers",
+        "trade", "trades", "traded", "trading", "trader", "traders",
+        "purchase", "purchases", "purchased", "purchasing",
+        "cost", "costs", "costing", "price", "prices", "priced", "pricing",
+    }), ()),
+    ("assistance_request", frozenset({
+        "help", "helps", "helped", "helping", "quest", "quests", "task", "tasks",
+        "problem", "problems", "need", "needs", "needed", "needing",
+    }), ()),
+    ("information_seeking", frozenset({
+        "know", "knows", "knew", "known", "knowing", "hear", "hears", "heard", "hearing",
+        "information", "what", "where", "who", "whom", "whose",
+    }), ("tell me",)),
+    ("confrontation", frozenset({
+        "threat", "threats", "threaten", "threatens", "threatened", "threatening",
+        "attack", "attacks", "attacked", "attacking", "fight", "fights", "fought", "fighting",
+        "surrender", "surrenders", "surrendered", "surrendering",
+        "stop", "stops", "stopped", "stopping",
+    }), ()),
+    ("greeting", frozenset({"hello", "greetings"}), ("good day", "how are"))
+)
+
+def _substitution(replacements: Dict[str, str]) -> Callable[[str], str]:
+    """Compile a substring -> replacement table into a single-pass rewrite function."""
+    pattern = re.compile("|".join(re.escape(old) for old in sorted(replacements, key=len, reverse=True)))
+    lookup = replacements.__getitem__
+    return functools.partial(pattern.sub, lambda match: lookup(match.group()))
+
+# Accent and vocabulary rewrites, each applied in one regex pass
+_SCOTTISH_REWRITE = _substitution({"you": "ye", "cannot": "cannae", "don't": "dinnae"})
+_FORMAL_REWRITE = _substitution({"you're": "you are", "don't": "do not", "won't": "will not", "can't": "cannot"})
+_RURAL_REWRITE = _substitution({"going": "goin'", "nothing": "nothin'", "something": "somethin'"})
+_SIMPLE_VOCAB_REWRITE = _substitution({
+    "assistance": "help",
+    "acquire": "get", 
+    "utilize": "use",
+    "demonstrate": "show",
+    "comprehend": "understand"
+})
 
 def create_npc_persona(name: str, 
                       race: str = "", 
@@ -56,112 +241,39 @@ def create_npc_persona(name: str,
     if personality_hints is None:
         personality_hints = []
     
-    # Base personality traits by occupation
-    occupation_traits = {
-        "merchant": ["shrewd", "persuasive", "materialistic", "calculating"],
-        "guard": ["dutiful", "suspicious", "protective", "authoritative"],
-        "scholar": ["curious", "analytical", "verbose", "absent-minded"],
-        "criminal": ["cunning", "secretive", "opportunistic", "street-smart"],
-        "noble": ["proud", "refined", "entitled", "diplomatic"],
-        "commoner": ["practical", "humble", "hardworking", "simple"],
-        "religious": ["devout", "compassionate", "wise", "ceremonial"]
-    }
-    
     # Generate traits
     traits = list(personality_hints)
-    if occupation.lower() in occupation_traits:
-        occupation_specific = occupation_traits[occupation.lower()]
-        traits.extend(random.sample(occupation_specific, min(2, len(occupation_specific))))
-    
-    # Add random universal traits
-    universal_traits = [
-        "optimistic", "pessimistic", "cautious", "brave", "generous", "selfish",
-        "honest", "deceptive", "patient", "impatient", "loyal", "independent",
-        "social", "reclusive", "ambitious", "content", "serious", "humorous"
-    ]
+    race_key = race.lower()
+    template = _OCCUPATIONS.get(occupation.lower(), _DEFAULT_OCCUPATION)
+    if template.traits:
+        traits.extend(random.sample(template.traits, min(2, len(template.traits))))
     
-    while len(traits) < 4:
-        trait = random.choice(universal_traits)
-        if trait not in traits:
-            traits.append(trait)
+    # Pad to four traits with distinct universal traits in a single draw
+    needed = 4 - len(traits)
+    if needed > 0:
+        pool = [trait for trait in _UNIVERSAL_TRAITS if trait not in traits]
+        traits.extend(random.sample(pool, min(needed, len(pool))))
     
     # Generate motivations based on occupation and traits
-    motivation_templates = {
-        "merchant": ["earn profit", "expand business", "maintain reputation"],
-        "guard": ["protect the innocent", "uphold the law", "earn promotion"],
-        "scholar": ["discover truth", "preserve knowledge", "teach others"],
-        "criminal": ["acquire wealth", "avoid capture", "gain power"],
-        "noble": ["maintain status", "protect family honor", "gain influence"],
-        "commoner": ["support family", "survive hardships", "find happiness"],
-        "religious": ["serve deity", "help the faithful", "spread teachings"]
-    }
-    
-    motivations = motivation_templates.get(occupation.lower(), ["survive", "find purpose", "help others"])
+    motivations = list(template.motivations)
     
     # Generate fears
-    fear_options = [
-        "death", "poverty", "abandonment", "failure", "exposure of secrets",
-        "loss of status", "physical harm", "supernatural threats", "betrayal",
-        "change", "authority", "the unknown", "public speaking", "magic"
-    ]
-    fears = random.sample(fear_options, random.randint(1, 3))
+    fears = random.sample(_FEAR_OPTIONS, random.randint(1, 3))
     
     # Generate speech patterns
     speech_patterns = {}
     
-    # Accent/dialect based on race
-    race_accents = {
-        "dwarf": {"accent": "Scottish-inspired", "quirks": "Uses 'aye' frequently, calls people 'lad/lass'"},
-        "elf": {"accent": "Melodic, formal", "quirks": "Speaks precisely, uses archaic terms"},
-        "halfling": {"accent": "Rural, friendly", "quirks": "Mentions food often, uses diminutives"},
-        "human": {"accent": "Varies by region", "quirks": "Depends on background"},
-        "tiefling": {"accent": "Smooth, sometimes sinister", "quirks": "May use infernal expressions"},
-        "dragonborn": {"accent": "Formal, draconic influence", "quirks": "References honor frequently"}
-    }
-    
-    if race.lower() in race_accents:
-        speech_patterns.update(race_accents[race.lower()])
+    if race_key in _RACE_ACCENTS:
+        speech_patterns.update(_RACE_ACCENTS[race_key])
     else:
         speech_patterns["accent"] = "Standard regional accent"
         speech_patterns["quirks"] = "No notable speech quirks"
     
-    # Vocabulary level by occupation
-    vocab_levels = {
-        "scholar": "highly educated, uses complex terms",
-        "noble": "refined, formal language",
-        "commoner": "simple, practical language",
-        "criminal": "street slang, informal",
-        "merchant": "business terminology, persuasive",
-        "guard": "direct, authoritative",
-        "religious": "ceremonial, spiritual terminology"
-    }
-    
-    speech_patterns["vocabulary_level"] = vocab_levels.get(occupation.lower(), "standard vocabulary")
-    
-    # Tone based on disposition
-    disposition_tones = {
-        NPCDisposition.HOSTILE: "aggressive, confrontational",
-        NPCDisposition.UNFRIENDLY: "cold, dismissive", 
-        NPCDisposition.NEUTRAL: "polite but distant",
-        NPCDisposition.FRIENDLY: "warm, welcoming",
-        NPCDisposition.HELPFUL: "eager to assist, encouraging"
-    }
-    
-    speech_patterns["tone"] = disposition_tones.get(disposition, "neutral tone")
+    speech_patterns["vocabulary_level"] = template.vocabulary_level
+    speech_patterns["tone"] = _DISPOSITION_TONES.get(disposition, "neutral tone")
     
     # Knowledge areas based on occupation and background
-    knowledge_areas = []
-    occupation_knowledge = {
-        "merchant": ["trade routes", "market prices", "business practices", "local economy"],
-        "guard": ["local laws", "security procedures", "criminal activity", "city layout"],
-        "scholar": ["history", "arcane knowledge", "research methods", "ancient texts"],
-        "criminal": ["underworld contacts", "illegal activities", "city secrets", "escape routes"],
-        "noble": ["politics", "court intrigue", "family lineages", "social customs"],
-        "commoner": ["local gossip", "daily life", "survival skills", "folk wisdom"],
-        "religious": ["theology", "rituals", "healing", "moral guidance"]
-    }
-    
-    knowledge_areas = occupation_knowledge.get(occupation.lower(), ["general local knowledge"])
+    knowledge_areas = list(template.knowledge_areas)
     
     return NPCPersona(
         name=name,
@@ -178,105 +290,120 @@ def create_npc_persona(name: str,
         goals=motivations[:2]  # Use top motivations as goals
     )
 
-def generate_npc_dialogue(persona: NPCPersona,
-                         player_input: str,
-                         conversation_context: str = "",
-                         current_situation: str = "") -> Dict[str, Any]:
-    """Generate appropriate dialogue for an NPC based on their persona and the situation."""
+# Responses that depend only on conversation type and disposition: (per-disposition lines, fallback)
+_DISPOSITION_RESPONSES = MappingProxyType({
+    "greeting": ({
+        NPCDisposition.HOSTILE: "What do you want? I have no time for pleasantries with your kind.",
+        NPCDisposition.UNFRIENDLY: "I suppose you expect some sort of welcome. Fine. You've been acknowledged.",
+        NPCDisposition.NEUTRAL: "Greetings, traveler. What brings you to speak with me?",
+        NPCDisposition.FRIENDLY: "Well met, friend! It's always a pleasure to meet new faces.",
+        NPCDisposition.HELPFUL: "Welcome, welcome! How wonderful to see you. Please, how may I be of service?"
+    }, ""),
+    "information_known": ({
+        NPCDisposition.FRIENDLY: "Ah, you've come to the right person! I know quite a bit about that subject.",
+        NPCDisposition.HELPFUL: "Ah, you've come to the right person! I know quite a bit about that subject.",
+        NPCDisposition.NEUTRAL: "I might have some information about that. What specifically do you want to know?"
+    }, "I might know something, but information isn't free around here."),
+    "general": ({
+        NPCDisposition.FRIENDLY: "It's nice to have someone to talk to. What's on your mind?",
+        NPCDisposition.UNFRIENDLY: "I suppose you want something. Most people do."
+    }, "Yes? What do you need?")
+})
+
+def _response_for(response_type: str, disposition: NPCDisposition) -> str:
+    """Look up a disposition-keyed response, falling back to the type's default line."""
+    responses, fallback = _DISPOSITION_RESPONSES[response_type]
+    return responses.get(disposition, fallback)
+
+@functools.lru_cache(maxsize=4096)
+def _classify_and_respond(disposition: NPCDisposition, occupation_key: str, traits: FrozenSet[str],
+                          fears_death: bool, knowledge_areas: Tuple[str, ...],
+                          player_lower: str) -> Tuple[str, str]:
+    """Conversation type and unstyled base response; deterministic, so memoized."""
     
-    player_lower = player_input.lower()
-    context_lower = conversation_context.lower()
-    situation_lower = current_situation.lower()
+    player_tokens = frozenset(_WORD_RE.findall(player_lower))
     
-    # Determine conversation type
+    # Determine conversation type: first type whose keywords appear as whole words wins
     conversation_type = "general"
-    if any(word in player_lower for word in ["buy", "sell", "trade", "purchase", "cost", "price"]):
-        conversation_type = "commerce"
-    elif any(word in player_lower for word in ["help", "quest", "task", "problem", "need"]):
-        conversation_type = "assistance_request"
-    elif any(word in player_lower for word in ["know", "heard", "information", "tell me", "what", "where", "who"]):
-        conversation_type = "information_seeking"
-    elif any(word in player_lower for word in ["threat", "attack", "fight", "surrender", "stop"]):
-        conversation_type = "confrontation"
-    elif any(word in player_lower for word in ["hello", "greetings", "good day", "how are"]):
-        conversation_type = "greeting"
+    for candidate_type, keywords, phrases in _CONVERSATION_KEYWORDS:
+        if not keywords.isdisjoint(player_tokens) or any(phrase in player_lower for phrase in phrases):
+            conversation_type = candidate_type
+            break
     
     # Base response based on disposition and conversation type
     response_content = ""
     
     if conversation_type == "greeting":
-        if persona.disposition == NPCDisposition.HOSTILE:
-            response_content = "What do you want? I have no time for pleasantries with your kind."
-        elif persona.disposition == NPCDisposition.UNFRIENDLY:
-            response_content = "I suppose you expect some sort of welcome. Fine. You've been acknowledged."
-        elif persona.disposition == NPCDisposition.NEUTRAL:
-            response_content = "Greetings, traveler. What brings you to speak with me?"
-        elif persona.disposition == NPCDisposition.FRIENDLY:
-            response_content = "Well met, friend! It's always a pleasure to meet new faces."
-        elif persona.disposition == NPCDisposition.HELPFUL:
-            response_content = "Welcome, welcome! How wonderful to see you. Please, how may I be of service?"
+        response_content = _response_for("greeting", disposition)
     
     elif conversation_type == "information_seeking":
-        knowledge_relevant = any(area for area in persona.knowledge_areas 
-                               if any(keyword in player_lower for keyword in area.split()))
+        knowledge_relevant = any(not player_tokens.isdisjoint(area.lower().split())
+                                 for area in knowledge_areas)
         
         if knowledge_relevant:
-            if persona.disposition in [NPCDisposition.FRIENDLY, NPCDisposition.HELPFUL]:
-                response_content = "Ah, you've come to the right person! I know quite a bit about that subject."
-            elif persona.disposition == NPCDisposition.NEUTRAL:
-                response_content = "I might have some information about that. What specifically do you want to know?"
-            else:
-                response_content = "I might know something, but information isn't free around here."
+            response_content = _response_for("information_known", disposition)
         else:
             response_content = "I'm afraid I don't know much about that topic. You might want to ask someone else."
     
     elif conversation_type == "assistance_request":
-        if "helpful" in persona.personality_traits or persona.disposition == NPCDisposition.HELPFUL:
+        if "helpful" in traits or disposition == NPCDisposition.HELPFUL:
             response_content = "I'd be happy to help if I can. What do you need?"
-        elif "selfish" in persona.personality_traits or persona.disposition == NPCDisposition.UNFRIENDLY:
+        elif "selfish" in traits or disposition == NPCDisposition.UNFRIENDLY:
             response_content = "Help? What's in it for me? I don't work for free."
-        elif "suspicious" in persona.personality_traits:
+        elif "suspicious" in traits:
             response_content = "Help with what, exactly? I need to know what I'm getting myself into."
         else:
             response_content = "I might be able to assist, depending on what you need."
     
     elif conversation_type == "commerce":
-        if persona.occupation.lower() == "merchant":
+        if occupation_key == "merchant":
             response_content = "Now you're speaking my language! What are you looking to buy or sell?"
-        elif persona.disposition == NPCDisposition.HELPFUL:
+        elif disposition == NPCDisposition.HELPFUL:
             response_content = "I'm not a merchant myself, but I might be able to point you toward someone who can help."
         else:
             response_content = "I'm not in the business of trading, I'm afraid."
     
     elif conversation_type == "confrontation":
-        if persona.disposition == NPCDisposition.HOSTILE:
+        if disposition == NPCDisposition.HOSTILE:
             response_content = "You dare threaten me? You'll regret those words!"
-        elif "brave" in persona.personality_traits:
+        elif "brave" in traits:
             response_content = "I won't be intimidated by the likes of you. Stand down!"
-        elif "coward" in persona.personality_traits or "death" in persona.fears:
+        elif "coward" in traits or fears_death:
             response_content = "Please, I don't want any trouble! I'll do whatever you want!"
         else:
             response_content = "Let's not resort to violence. Surely we can resolve this peacefully."
     
     else:  # general conversation
-        if persona.disposition == NPCDisposition.FRIENDLY:
-            response_content = "It's nice to have someone to talk to. What's on your mind?"
-        elif persona.disposition == NPCDisposition.UNFRIENDLY:
-            response_content = "I suppose you want something. Most people do."
-        else:
-            response_content = "Yes? What do you need?"
+        response_content = _response_for("general", disposition)
+    
+    return conversation_type, response_content
+
+def generate_npc_dialogue(persona: NPCPersona,
+                         player_input: str,
+                         conversation_context: str = "",
+                         current_situation: str = "") -> Dict[str, Any]:
+    """Generate appropriate dialogue for an NPC based on their persona and the situation."""
+    
+    player_lower = player_input.lower()
+    situation_tokens = frozenset(_WORD_RE.findall(current_situation.lower()))
+    
+    # Classification and base response depend only on the persona profile and the input
+    conversation_type, response_content = _classify_and_respond(
+        persona.disposition, persona._occupation_key, persona.personality_traits_set,
+        "death" in persona.fears, tuple(persona.knowledge_areas), player_lower
+    )
     
     # Apply speech patterns to the response
-    styled_response = apply_speech_patterns(response_content, persona.speech_patterns)
+    styled_response = _speech_transformer(persona)(response_content)
     
     # Add personality-based modifications
-    if "humorous" in persona.personality_traits and conversation_type not in ["confrontation"]:
+    if "humorous" in persona.personality_traits_set and conversation_type not in ["confrontation"]:
         styled_response += " *chuckles*"
-    elif "serious" in persona.personality_traits:
+    elif "serious" in persona.personality_traits_set:
         styled_response = styled_response.replace("!", ".")
     
     # Consider current situation modifiers
-    if "combat" in situation_lower:
+    if "combat" in situation_tokens:
         if persona.disposition in [NPCDisposition.HOSTILE, NPCDisposition.UNFRIENDLY]:
             styled_response = f"*ready for battle* {styled_response}"
         else:
@@ -293,66 +420,98 @@ def generate_npc_dialogue(persona: NPCPersona,
         }
     }
 
+# Sentence-ending punctuation and the phrase pools used by speech quirks
+_TERMINAL_PUNCT = (".", "!", "?")
+_LAD_LASS = ("lad", "lass")
+_YE_YOU = ("ye", "you")
+_FOOD_REFERENCES = (
+    "Speaking of which, I could go for a good meal.",
+    "This talk is making me hungry.",
+    "Have you tried the bread here? Excellent!"
+)
+
+def _add_aye_tag(text: str) -> str:
+    """Close an unpunctuated Scottish-accented line with a questioning 'aye'."""
+    if not text.endswith(_TERMINAL_PUNCT):
+        text += ", aye?"
+    return text
+
+def _aye_quirk(text: str) -> str:
+    """Occasionally tack on an 'Aye.'"""
+    if random.random() < 0.3:  # 30% chance to add 'aye'
+        text += " Aye."
+    return text
+
+def _lad_lass_quirk(text: str) -> str:
+    """Address the listener as lad or lass."""
+    # One draw supplies both independent coin flips
+    bits = random.getrandbits(2)
+    text = text.replace("friend", _LAD_LASS[bits & 1])
+    return text.replace("you", _YE_YOU[bits >> 1])
+
+def _food_quirk(text: str) -> str:
+    """Occasionally drift onto the subject of food."""
+    # One draw: low 16 bits for the 20% roll, high 16 bits pick the line
+    bits = random.getrandbits(32)
+    if (bits & 0xFFFF) < 0.2 * 0x10000:  # 20% chance to mention food
+        text += f" {_FOOD_REFERENCES[(bits >> 16) % len(_FOOD_REFERENCES)]}"
+    return text
+
+def _run_speech_steps(steps: tuple, text: str) -> str:
+    """Apply each rewrite step to the text in order."""
+    for step in steps:
+        text = step(text)
+    return text
+
+def _identity_speech(text: str) -> str:
+    """Transformer for speech profiles that change nothing."""
+    return text
+
+def _build_speech_transformer(speech_patterns: Dict[str, str]) -> Callable[[str], str]:
+    """Resolve a speech profile once into the ordered rewrite steps it implies."""
+    steps = []
+    
+    # Accent/dialect modifications
+    accent = speech_patterns.get("accent", "").lower()
+    if "scottish" in accent:
+        steps += (_SCOTTISH_REWRITE, _add_aye_tag)
+    elif "formal" in accent:
+        steps.append(_FORMAL_REWRITE)
+    elif "rural" in accent:
+        steps.append(_RURAL_REWRITE)
+    
+    # Vocabulary level modifications; highly educated speech keeps complex language as is
+    vocab = speech_patterns.get("vocabulary_level", "")
+    if "highly educated" not in vocab and ("simple" in vocab or "practical" in vocab):
+        steps.append(_SIMPLE_VOCAB_REWRITE)
+    
+    # Quirks (randomized per call)
+    quirks = speech_patterns.get("quirks", "").lower()
+    if "aye" in quirks:
+        steps.append(_aye_quirk)
+    elif "lad/lass" in quirks:
+        steps.append(_lad_lass_quirk)
+    elif "food" in quirks:
+        steps.append(_food_quirk)
+    
+    # Plain profiles ("Standard regional accent", no quirks) skip the step loop entirely
+    if not steps:
+        return _identity_speech
+    return functools.partial(_run_speech_steps, tuple(steps))
+
+def _speech_transformer(persona: NPCPersona) -> Callable[[str], str]:
+    """The persona's speech transformer, built on first use.
+    
+    The transformer is not rebuilt if speech_patterns is edited in place afterwards;
+    reset persona._speech_transformer to None after such an edit.
+    """
+    if persona._speech_transformer is None:
+        persona._speech_transformer = _build_speech_transformer(persona.speech_patterns)
+    return persona._speech_transformer
+
 def apply_speech_patterns(text: str, speech_patterns: Dict[str, str]) -> str:
     """Apply speech patterns to modify text according to NPC characteristics."""
-    
-    styled_text = text
-    
-    # Apply accent/dialect modifications
-    accent = speech_patterns.get("accent", "")
-    if "scottish" in accent.lower():
-        styled_text = styled_text.replace("you", "ye")
-        styled_text = styled_text.replace("cannot", "cannae")
-        styled_text = styled_text.replace("don't", "dinnae")
-        if not styled_text.endswith((".", "!", "?")):
-            styled_text += ", aye?"
-    
-    elif "formal" in accent.lower():
-        styled_text = styled_text.replace("you're", "you are")
-        styled_text = styled_text.replace("don't", "do not")
-        styled_text = styled_text.replace("won't", "will not")
-        styled_text = styled_text.replace("can't", "cannot")
-    
-    elif "rural" in accent.lower():
-        styled_text = styled_text.replace("going", "goin'")
-        styled_text = styled_text.replace("nothing", "nothin'")
-        styled_text = styled_text.replace("something", "somethin'")
-    
-    # Apply vocabulary level modifications
-    vocab = speech_patterns.get("vocabulary_level", "")
-    if "highly educated" in vocab:
-        # Keep complex language as is
-        pass
-    elif "simple" in vocab or "practical" in vocab:
-        # Simplify complex words
-        replacements = {
-            "assistance": "help",
-            "acquire": "get", 
-            "utilize": "use",
-            "demonstrate": "show",
-            "comprehend": "understand"
-        }
-        for complex_word, simple_word in replacements.items():
-            styled_text = styled_text.replace(complex_word, simple_word)
-    
-    # Apply quirks
-    quirks = speech_patterns.get("quirks", "")
-    if "aye" in quirks.lower():
-        if random.random() < 0.3:  # 30% chance to add 'aye'
-            styled_text += " Aye."
-    elif "lad/lass" in quirks.lower():
-        styled_text = styled_text.replace("friend", random.choice(["lad", "lass"]))
-        styled_text = styled_text.replace("you", random.choice(["ye", "you"]))
-    elif "food" in quirks.lower():
-        if random.random() < 0.2:  # 20% chance to mention food
-            food_references = [
-                "Speaking of which, I could go for a good meal.",
-                "This talk is making me hungry.",
-                "Have you tried the bread here? Excellent!"
-            ]
-            styled_text += f" {random.choice(food_references)}"
-    
-    return styled_text
+    return _build_speech_transformer(speech_patterns)(text)
 
 def make_npc_decision(persona: NPCPersona,
                      decision_context: str,
@@ -360,78 +519,76 @@ def make_npc_decision(persona: NPCPersona,
                      player_relationship: str = "stranger") -> Dict[str, Any]:
     """Determine what decision an NPC would make based on their personality and motivations."""
     
-    context_lower = decision_context.lower()
-    
-    # Score each option based on persona
-    option_scores = {}
+    if not available_options:
+        raise ValueError("available_options must not be empty")
     
-    for option in available_options:
-        score = 0
-        option_lower = option.lower()
-        
-        # Base score from disposition toward players
-        disposition_modifiers = {
-            NPCDisposition.HOSTILE: -30,
-            NPCDisposition.UNFRIENDLY: -10,
-            NPCDisposition.NEUTRAL: 0,
-            NPCDisposition.FRIENDLY: 10,
-            NPCDisposition.HELPFUL: 20
-        }
-        score += disposition_modifiers.get(persona.disposition, 0)
-        
-        # Relationship modifier
-        relationship_modifiers = {
-            "enemy": -50,
-            "rival": -20,
-            "stranger": 0,
-            "acquaintance": 10,
-            "friend": 25,
-            "ally": 40
-        }
-        score += relationship_modifiers.get(player_relationship, 0)
+    return _decide(persona, available_options, [option.lower() for option in available_options],
+                   player_relationship)
+
+def make_npc_decisions(personas: List[NPCPersona],
+                      decision_context: str,
+                      available_options: List[str],
+                      player_relationships: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+    """Decide for several NPCs facing the same options (e.g. a crowd reacting to the party)."""
+    
+    if not available_options:
+        raise ValueError("available_options must not be empty")
+    if player_relationships is None:
+        player_relationships = {}
+    
+    # The shared options are lowercased once for the whole group
+    options_lower = [option.lower() for option in available_options]
+    return [
+        _decide(persona, available_options, options_lower,
+                player_relationships.get(persona.name, "stranger"))
+        for persona in personas
+    ]
+
+def _decide(persona: NPCPersona,
+            available_options: List[str],
+            options_lower: List[str],
+            player_relationship: str) -> Dict[str, Any]:
+    """Score pre-lowercased options for one persona and explain the choice."""
+    
+    # Everything that depends only on the persona is resolved once, outside the option loop
+    base_score = (_DISPOSITION_MODIFIERS.get(persona.disposition, 0)
+                  + _RELATIONSHIP_MODIFIERS.get(player_relationship, 0))
+    score_rules = [_TRAIT_OPTION_SCORES[trait] for trait in persona.personality_traits
+                   if trait in _TRAIT_OPTION_SCORES]
+    occupation_rule = _OCCUPATION_OPTION_SCORES.get(persona._occupation_key)
+    if occupation_rule is not None:
+        score_rules.append(occupation_rule)
+    motivation_words = [motivation.split() for motivation in persona.motivations]
+    fear_words = [fear.split() for fear in persona.fears]
+    
+    # Score each option based on persona, tracking the best (first on ties) as we go
+    option_score_list = []
+    best_index, best_score = 0, None
+    
+    for index, option_lower in enumerate(options_lower):
+        score = base_score
         
-        # Personality trait influences
-        for trait in persona.personality_traits:
-            if trait == "helpful" and ("help" in option_lower or "assist" in option_lower):
-                score += 20
-            elif trait == "selfish" and ("help" in option_lower or "sacrifice" in option_lower):
-                score -= 15
-            elif trait == "brave" and ("fight" in option_lower or "stand" in option_lower):
-                score += 15
-            elif trait == "cautious" and ("risk" in option_lower or "dangerous" in option_lower):
-                score -= 20
-            elif trait == "greedy" and ("gold" in option_lower or "reward" in option_lower):
-                score += 25
-            elif trait == "honest" and ("lie" in option_lower or "deceive" in option_lower):
-                score -= 30
-            elif trait == "loyal" and ("betray" in option_lower or "abandon" in option_lower):
-                score -= 40
+        # Personality trait and occupation influences
+        for keywords, score_change in score_rules:
+            if any(keyword in option_lower for keyword in keywords):
+                score += score_change
         
         # Motivation alignment
-        for motivation in persona.motivations:
-            if any(word in option_lower for word in motivation.split()):
+        for words in motivation_words:
+            if any(word in option_lower for word in words):
                 score += 30
         
         # Fear considerations
-        for fear in persona.fears:
-            if any(word in option_lower for word in fear.split()):
+        for words in fear_words:
+            if any(word in option_lower for word in words):
                 score -= 25
         
-        # Occupation-specific considerations
-        if persona.occupation.lower() == "merchant":
-            if "profit" in option_lower or "business" in option_lower:
-                score += 20
-        elif persona.occupation.lower() == "guard":
-            if "law" in option_lower or "protect" in option_lower:
-                score += 15
-        elif persona.occupation.lower() == "criminal":
-            if "illegal" in option_lower or "steal" in option_lower:
-                score += 10
-        
-        option_scores[option] = score
+        option_score_list.append(score)
+        if best_score is None or score > best_score:
+            best_index, best_score = index, score
     
-    # Select the highest scoring option
-    chosen_option = max(option_scores.items(), key=lambda x: x[1])
+    chosen_option = (available_options[best_index], best_score)
+    option_scores = dict(zip(available_options, option_score_list))
     
     # Generate reasoning for the decision
     reasoning_factors = []
@@ -499,5 +656,5 @@ Use the provided tools to:
 - Make in-character decisions that advance the story
 
 Remember: Every NPC is a real person with their own goals, fears, relationships, and quirks. Your job is to make them feel alive and authentic, whether they're a humble shopkeeper, a noble lord, or a fearsome dragon. Each character should have their own voice and agency within the world.""",
-    tools=[create_npc_persona, generate_npc_dialogue, apply_speech_patterns, make_npc_decision]
+    tools=[create_npc_persona, generate_npc_dialogue, apply_speech_patterns, make_npc_decision, make_npc_decisions]
 )
\ No newline at end of file